@@ -8,35 +8,13 @@ import os
 import pwd
 import subprocess
 from pathlib import Path
-from typing import Coroutine, List
+from typing import TYPE_CHECKING, Coroutine, List
 
 import path_util  # noqa: F401
 
-from bin.hummingbot import UIStartListener, detect_available_port
-from hummingbot import init_logging
-from hummingbot.client.command.start_command import GATEWAY_READY_TIMEOUT
-from hummingbot.client.config.config_crypt import BaseSecretsManager, ETHKeyFileSecretManger
-from hummingbot.client.config.config_helpers import (
-    ClientConfigAdapter,
-    all_configs_complete,
-    create_yml_files_legacy,
-    load_client_config_map_from_file,
-    load_strategy_config_map_from_file,
-    read_system_configs_from_yml,
-)
-from hummingbot.client.config.security import Security
-from hummingbot.client.hummingbot_application import HummingbotApplication
-from hummingbot.client.settings import (
-    SCRIPT_STRATEGIES_PATH,
-    SCRIPT_STRATEGY_CONF_DIR_PATH,
-    STRATEGIES_CONF_DIR_PATH,
-    AllConnectorSettings,
-)
-from hummingbot.client.ui import login_prompt
-from hummingbot.client.ui.style import load_style
-from hummingbot.core.event.events import HummingbotUIEvent
-from hummingbot.core.management.console import start_management_console
-from hummingbot.core.utils.async_utils import safe_gather
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_crypt import BaseSecretsManager
+    from hummingbot.client.hummingbot_application import HummingbotApplication
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -87,8 +65,18 @@ def autofix_permissions(user_group_spec: str):
     os.setuid(uid)
 
 
-async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsManager):
+async def quick_start(args: argparse.Namespace, secrets_manager: "BaseSecretsManager"):
     """Start Hummingbot using unified HummingbotApplication in either UI or headless mode."""
+    from hummingbot import init_logging
+    from hummingbot.client.config.config_helpers import (
+        create_yml_files_legacy,
+        load_client_config_map_from_file,
+        read_system_configs_from_yml,
+    )
+    from hummingbot.client.config.security import Security
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+    from hummingbot.client.settings import AllConnectorSettings
+
     client_config_map = load_client_config_map_from_file()
 
     if args.auto_set_permissions is not None:
@@ -100,8 +88,14 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
     await Security.wait_til_decryption_done()
     await create_yml_files_legacy()
-    # Initialize logging with basic setup first - will be re-initialized later with correct strategy file name if needed
-    init_logging("hummingbot_logs.yml", client_config_map)
+    # Initialize logging once; in headless mode the strategy file name is already known from the arguments
+    if args.headless:
+        log_file_name = Path(args.script_conf or args.config_file_name).stem if args.config_file_name else "hummingbot"
+        init_logging("hummingbot_logs.yml", client_config_map,
+                     override_log_level=client_config_map.log_level,
+                     strategy_file_path=log_file_name)
+    else:
+        init_logging("hummingbot_logs.yml", client_config_map)
     await read_system_configs_from_yml()
 
     # Automatically enable MQTT autostart for headless mode
@@ -128,8 +122,12 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
 async def wait_for_gateway_ready(hb):
     """Wait until the gateway is ready before starting the strategy."""
+    from hummingbot.client.command.start_command import GATEWAY_READY_TIMEOUT
+    from hummingbot.client.settings import AllConnectorSettings
+
+    connector_settings = AllConnectorSettings.get_connector_settings()
     exchange_settings = [
-        AllConnectorSettings.get_connector_settings().get(e, None)
+        connector_settings.get(e, None)
         for e in hb.trading_core.connector_manager.connectors.keys()
     ]
     uses_gateway = any([s.uses_gateway_generic_connector() for s in exchange_settings])
@@ -144,28 +142,39 @@ async def wait_for_gateway_ready(hb):
         raise
 
 
-async def load_and_start_strategy(hb: HummingbotApplication, args: argparse.Namespace,):
+async def load_and_start_strategy(hb: "HummingbotApplication", args: argparse.Namespace,):
     """Load and start strategy based on file type and mode."""
+    from hummingbot.client.config.config_helpers import (
+        ClientConfigAdapter,
+        all_configs_complete,
+        load_strategy_config_map_from_file,
+    )
+    from hummingbot.client.settings import (
+        SCRIPT_STRATEGIES_PATH,
+        SCRIPT_STRATEGY_CONF_DIR_PATH,
+        STRATEGIES_CONF_DIR_PATH,
+    )
+
     if args.config_file_name.endswith(".py"):
         # Script strategy
-        strategy_name = args.config_file_name.replace(".py", "")
+        strategy_name = Path(args.config_file_name).stem
         strategy_config_file = args.script_conf  # Optional config file for script
 
         # Validate that the script file exists
         script_file_path = SCRIPT_STRATEGIES_PATH / args.config_file_name
-        if not script_file_path.exists():
+        if not script_file_path.is_file():
             logging.getLogger().error(f"Script file not found: {script_file_path}")
             return False
 
         # Validate that the script config file exists if provided
         if strategy_config_file:
             script_config_path = SCRIPT_STRATEGY_CONF_DIR_PATH / strategy_config_file
-            if not script_config_path.exists():
+            if not script_config_path.is_file():
                 logging.getLogger().error(f"Script config file not found: {script_config_path}")
                 return False
 
         # Set strategy_file_name to config file if provided, otherwise script file (matching start_command logic)
-        hb.strategy_file_name = strategy_config_file.split(".")[0] if strategy_config_file else strategy_name
+        hb.strategy_file_name = Path(strategy_config_file).stem if strategy_config_file else strategy_name
         hb.strategy_name = strategy_name
 
         if args.headless:
@@ -184,7 +193,7 @@ async def load_and_start_strategy(hb: HummingbotApplication, args: argparse.Name
                 hb.script_config = strategy_config_file
     else:
         # Regular strategy with YAML config
-        hb.strategy_file_name = args.config_file_name.split(".")[0]  # Remove .yml extension
+        hb.strategy_file_name = Path(args.config_file_name).stem  # Remove .yml extension
 
         try:
             strategy_config = await load_strategy_config_map_from_file(
@@ -225,15 +234,15 @@ async def load_and_start_strategy(hb: HummingbotApplication, args: argparse.Name
     return True
 
 
-async def run_application(hb: HummingbotApplication, args: argparse.Namespace, client_config_map):
+async def run_application(hb: "HummingbotApplication", args: argparse.Namespace, client_config_map):
     """Run the application in headless or UI mode."""
+    from bin.hummingbot import UIStartListener, detect_available_port
+    from hummingbot.core.event.events import HummingbotUIEvent
+    from hummingbot.core.management.console import start_management_console
+    from hummingbot.core.utils.async_utils import safe_gather
+
     if args.headless:
-        # Re-initialize logging with proper strategy file name for headless mode
-        from hummingbot import init_logging
-        log_file_name = hb.strategy_file_name.split(".")[0] if hb.strategy_file_name else "hummingbot"
-        init_logging("hummingbot_logs.yml", hb.client_config_map,
-                     override_log_level=hb.client_config_map.log_level,
-                     strategy_file_path=log_file_name)
+        # Logging was already initialized with the strategy file name in quick_start
         await hb.run()
     else:
         # Set up UI mode with start listener
@@ -256,20 +265,29 @@ async def run_application(hb: HummingbotApplication, args: argparse.Namespace, c
 def main():
     args = CmdlineParser().parse_args()
 
+    from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger
+    from hummingbot.client.config.config_helpers import load_client_config_map_from_file
+    from hummingbot.client.ui import login_prompt
+    from hummingbot.client.ui.style import load_style
+
     # Parse environment variables from Dockerfile.
     # If an environment variable is not empty and it's not defined in the arguments, then we'll use the environment
     # variable.
-    if args.config_file_name is None and len(os.environ.get("CONFIG_FILE_NAME", "")) > 0:
-        args.config_file_name = os.environ["CONFIG_FILE_NAME"]
+    config_file_name_env = os.environ.get("CONFIG_FILE_NAME", "")
+    if args.config_file_name is None and len(config_file_name_env) > 0:
+        args.config_file_name = config_file_name_env
 
-    if args.script_conf is None and len(os.environ.get("SCRIPT_CONFIG", "")) > 0:
-        args.script_conf = os.environ["SCRIPT_CONFIG"]
+    script_config_env = os.environ.get("SCRIPT_CONFIG", "")
+    if args.script_conf is None and len(script_config_env) > 0:
+        args.script_conf = script_config_env
 
-    if args.config_password is None and len(os.environ.get("CONFIG_PASSWORD", "")) > 0:
-        args.config_password = os.environ["CONFIG_PASSWORD"]
+    config_password_env = os.environ.get("CONFIG_PASSWORD", "")
+    if args.config_password is None and len(config_password_env) > 0:
+        args.config_password = config_password_env
 
-    if args.headless is None and len(os.environ.get("HEADLESS_MODE", "")) > 0:
-        args.headless = os.environ["HEADLESS_MODE"].lower() == "true"
+    headless_mode_env = os.environ.get("HEADLESS_MODE", "")
+    if args.headless is None and len(headless_mode_env) > 0:
+        args.headless = headless_mode_env.lower() == "true"
 
     # If no password is given from the command line, prompt for one.
     secrets_manager_cls = ETHKeyFileSecretManger
@@ -281,13 +299,7 @@ def main():
     else:
         secrets_manager = secrets_manager_cls(args.config_password)
 
-    try:
-        ev_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
-    except RuntimeError:
-        ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
-        asyncio.set_event_loop(ev_loop)
-
-    ev_loop.run_until_complete(quick_start(args, secrets_manager))
+    asyncio.run(quick_start(args, secrets_manager))
 
 
 if __name__ == "__main__":
@@ -19,6 +19,11 @@ from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefinedType
 from yaml import SafeDumper
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from hummingbot import get_strategy_list, root_path
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientConfigEnum, ClientFieldData
@@ -603,7 +608,7 @@ def validate_strategy_file(file_path: Path) -> Optional[str]:
 
 def read_yml_file(yml_path: Path) -> Dict[str, Any]:
     with open(yml_path, "r", encoding="utf-8") as file:
-        data = yaml.safe_load(file) or {}
+        data = yaml.load(file, Loader=SafeLoader) or {}
     return dict(data)
 
 
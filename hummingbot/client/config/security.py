@@ -103,7 +103,8 @@ class Security:
 
     @classmethod
     async def wait_til_decryption_done(cls):
-        await cls._decryption_done.wait()
+        if not cls._decryption_done.is_set():
+            await cls._decryption_done.wait()
 
     @classmethod
     def api_keys(cls, connector_name: str) -> Dict[str, Optional[str]]:
@@ -40,6 +40,24 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
         self._trading_pairs: List[str] = trading_pairs
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
         self._snapshot_messages_queue_key = "order_book_snapshot"
+        self._channel_map = {
+            CONSTANTS.DEPTH_ENDPOINT_NAME: self._snapshot_messages_queue_key,
+            CONSTANTS.TRADES_ENDPOINT_NAME: self._trade_messages_queue_key,
+        }
+        self._symbol_to_trading_pair: Dict[str, str] = {}
+        self._trading_pair_to_coin: Dict[str, str] = {}
+        self._coin_to_universe_index: Dict[str, int] = {}
+
+    async def _resolve_trading_pair(self, exchange_symbol: str) -> str:
+        """
+        Resolves and caches the trading pair for an exchange symbol. The symbol map is static for
+        the session, so after the first resolution every depth/trade tick is a plain dict hit.
+        """
+        trading_pair = self._symbol_to_trading_pair.get(exchange_symbol)
+        if trading_pair is None:
+            trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(exchange_symbol)
+            self._symbol_to_trading_pair[exchange_symbol] = trading_pair
+        return trading_pair
 
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -48,18 +66,28 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
 
     async def get_funding_info(self, trading_pair: str) -> FundingInfo:
         response: List = await self._request_complete_funding_info(trading_pair)
-        ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        coin = ex_trading_pair.split("-")[0]
-        for index, i in enumerate(response[0]['universe']):
-            if i['name'] == coin:
-                funding_info = FundingInfo(
-                    trading_pair=trading_pair,
-                    index_price=Decimal(response[1][index]['oraclePx']),
-                    mark_price=Decimal(response[1][index]['markPx']),
-                    next_funding_utc_timestamp=self._next_funding_time(),
-                    rate=Decimal(response[1][index]['funding']),
-                )
-                return funding_info
+        coin = self._trading_pair_to_coin.get(trading_pair)
+        if coin is None:
+            ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            coin = ex_trading_pair.split("-")[0]
+            self._trading_pair_to_coin[trading_pair] = coin
+        universe = response[0]['universe']
+        # The universe ordering is stable between responses, so remember each coin's index and
+        # only rescan if the cached slot no longer matches
+        index = self._coin_to_universe_index.get(coin)
+        if index is None or index >= len(universe) or universe[index]['name'] != coin:
+            index = next((i for i, entry in enumerate(universe) if entry['name'] == coin), None)
+            if index is None:
+                return None
+            self._coin_to_universe_index[coin] = index
+        asset_context = response[1][index]
+        return FundingInfo(
+            trading_pair=trading_pair,
+            index_price=Decimal(asset_context['oraclePx']),
+            mark_price=Decimal(asset_context['markPx']),
+            next_funding_utc_timestamp=self._next_funding_time(),
+            rate=Decimal(asset_context['funding']),
+        )
 
     async def listen_for_funding_info(self, output: asyncio.Queue):
         """
@@ -85,8 +113,13 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
                 await self._sleep(CONSTANTS.FUNDING_RATE_UPDATE_INTERNAL_SECOND)
 
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
-        ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        coin = ex_trading_pair.split("-")[0]
+        # After the first snapshot the coin comes from the cache, leaving the REST fetch as the
+        # only await in this method
+        coin = self._trading_pair_to_coin.get(trading_pair)
+        if coin is None:
+            ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            coin = ex_trading_pair.split("-")[0]
+            self._trading_pair_to_coin[trading_pair] = coin
         params = {
             "type": 'l2Book',
             "coin": coin
@@ -121,6 +154,9 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
+            # The exchange only accepts one subscription per frame, so resolve all symbols and
+            # build every request first, then run the sends back to back
+            subscribe_requests: List[WSJSONRequest] = []
             for trading_pair in self._trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
                 coin = symbol.split("-")[0]
@@ -131,7 +167,7 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
                         "coin": coin,
                     }
                 }
-                subscribe_trade_request: WSJSONRequest = WSJSONRequest(payload=trades_payload)
+                subscribe_requests.append(WSJSONRequest(payload=trades_payload))
 
                 order_book_payload = {
                     "method": "subscribe",
@@ -140,12 +176,12 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
                         "coin": coin,
                     }
                 }
-                subscribe_orderbook_request: WSJSONRequest = WSJSONRequest(payload=order_book_payload)
+                subscribe_requests.append(WSJSONRequest(payload=order_book_payload))
 
-                await ws.send(subscribe_trade_request)
-                await ws.send(subscribe_orderbook_request)
+            for subscribe_request in subscribe_requests:
+                await ws.send(subscribe_request)
 
-                self.logger().info("Subscribed to public order book, trade channels...")
+            self.logger().info("Subscribed to public order book, trade channels...")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -153,20 +189,14 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
             raise
 
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
-        channel = ""
-        if "result" not in event_message:
-            stream_name = event_message.get("channel")
-            if "l2Book" in stream_name:
-                channel = self._snapshot_messages_queue_key
-            elif "trades" in stream_name:
-                channel = self._trade_messages_queue_key
-        return channel
+        if "result" in event_message:
+            return ""
+        return self._channel_map.get(event_message.get("channel"), "")
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        timestamp: float = raw_message["data"]["time"] * 1e-3
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-            raw_message["data"]["coin"] + '-' + CONSTANTS.CURRENCY)
         data = raw_message["data"]
+        timestamp: float = data["time"] * 1e-3
+        trading_pair = await self._resolve_trading_pair(data["coin"] + '-' + CONSTANTS.CURRENCY)
         order_book_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": trading_pair,
             "update_id": data["time"],
@@ -176,10 +206,9 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
         message_queue.put_nowait(order_book_message)
 
     async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        timestamp: float = raw_message["data"]["time"] * 1e-3
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-            raw_message["data"]["coin"] + '-' + CONSTANTS.CURRENCY)
         data = raw_message["data"]
+        timestamp: float = data["time"] * 1e-3
+        trading_pair = await self._resolve_trading_pair(data["coin"] + '-' + CONSTANTS.CURRENCY)
         order_book_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "trading_pair": trading_pair,
             "update_id": data["time"],
@@ -190,9 +219,16 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
 
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         data = raw_message["data"]
+        # Trades in a burst almost always share the same coin; resolve the trading pair only
+        # when it changes so the loop body stays synchronous
+        current_coin = None
+        trading_pair = None
+        put_nowait = message_queue.put_nowait
         for trade_data in data:
-            trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-                trade_data["coin"] + '-' + CONSTANTS.CURRENCY)
+            coin = trade_data["coin"]
+            if coin != current_coin:
+                trading_pair = await self._resolve_trading_pair(coin + '-' + CONSTANTS.CURRENCY)
+                current_coin = coin
             trade_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.TRADE, {
                 "trading_pair": trading_pair,
                 "trade_type": float(TradeType.SELL.value) if trade_data["side"] == "A" else float(
@@ -202,7 +238,7 @@ class HyperliquidPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource
                 "amount": float(trade_data["sz"])
             }, timestamp=trade_data["time"] * 1e-3)
 
-            message_queue.put_nowait(trade_message)
+            put_nowait(trade_message)
 
     async def _parse_funding_info_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         pass
@@ -1,9 +1,9 @@
-import json
 import time
-from collections import OrderedDict
+from functools import lru_cache
 
 import eth_account
 import msgpack
+import ujson
 from eth_account.messages import encode_typed_data
 from eth_utils import keccak, to_hex
 
@@ -15,16 +15,59 @@ from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
 
+@lru_cache(maxsize=8)
+def _wallet_from_key(api_secret: str):
+    """
+    Parsing key material into a wallet is relatively expensive; reuse the wallet when the
+    same secret constructs more than one connector (e.g. paper trading, multi-strategy).
+    Signing through the wallet is stateless, so sharing the instance is safe.
+    """
+    return eth_account.Account.from_key(api_secret)
+
+
+@lru_cache(maxsize=8)
+def _is_mainnet_url(base_url: str) -> bool:
+    """
+    The connector signs against a single base URL per session, so the mainnet/testnet
+    classification is resolved once here instead of substring-scanned per signature.
+    """
+    return CONSTANTS.PERPETUAL_BASE_URL in base_url
+
+
 class HyperliquidPerpetualAuth(AuthBase):
     """
     Auth class required by Hyperliquid Perpetual API
     """
 
+    # The EIP-712 domain/types skeleton is identical for every L1 action; only the message
+    # changes per signature, so build the static part once instead of per sign call
+    _L1_ACTION_TYPED_DATA = {
+        "domain": {
+            "chainId": 1337,
+            "name": "Exchange",
+            "verifyingContract": "0x0000000000000000000000000000000000000000",
+            "version": "1",
+        },
+        "types": {
+            "Agent": [
+                {"name": "source", "type": "string"},
+                {"name": "connectionId", "type": "bytes32"},
+            ],
+            "EIP712Domain": [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+                {"name": "verifyingContract", "type": "address"},
+            ],
+        },
+        "primaryType": "Agent",
+    }
+
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
         self._api_key: str = api_key
         self._api_secret: str = api_secret
         self._use_vault: bool = use_vault
-        self.wallet = eth_account.Account.from_key(api_secret)
+        self.wallet = _wallet_from_key(api_secret)
 
     @classmethod
     def address_to_bytes(cls, address):
@@ -53,28 +96,7 @@ class HyperliquidPerpetualAuth(AuthBase):
         _hash = self.action_hash(action, active_pool, nonce)
         phantom_agent = self.construct_phantom_agent(_hash, is_mainnet)
 
-        data = {
-            "domain": {
-                "chainId": 1337,
-                "name": "Exchange",
-                "verifyingContract": "0x0000000000000000000000000000000000000000",
-                "version": "1",
-            },
-            "types": {
-                "Agent": [
-                    {"name": "source", "type": "string"},
-                    {"name": "connectionId", "type": "bytes32"},
-                ],
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-            },
-            "primaryType": "Agent",
-            "message": phantom_agent,
-        }
+        data = {**self._L1_ACTION_TYPED_DATA, "message": phantom_agent}
         return self.sign_inner(wallet, data)
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
@@ -92,7 +114,7 @@ class HyperliquidPerpetualAuth(AuthBase):
             params,
             None if not self._use_vault else self._api_key,
             timestamp,
-            CONSTANTS.PERPETUAL_BASE_URL in base_url,
+            _is_mainnet_url(base_url),
         )
         payload = {
             "action": params,
@@ -103,16 +125,19 @@ class HyperliquidPerpetualAuth(AuthBase):
         return payload
 
     def _sign_cancel_params(self, params, base_url, timestamp):
+        cancels = params["cancels"]
+        if not isinstance(cancels, list):
+            cancels = [cancels]
         order_action = {
             "type": "cancelByCloid",
-            "cancels": [params["cancels"]],
+            "cancels": cancels,
         }
         signature = self.sign_l1_action(
             self.wallet,
             order_action,
             None if not self._use_vault else self._api_key,
             timestamp,
-            CONSTANTS.PERPETUAL_BASE_URL in base_url,
+            _is_mainnet_url(base_url),
         )
         payload = {
             "action": order_action,
@@ -137,7 +162,7 @@ class HyperliquidPerpetualAuth(AuthBase):
             order_action,
             None if not self._use_vault else self._api_key,
             timestamp,
-            CONSTANTS.PERPETUAL_BASE_URL in base_url,
+            _is_mainnet_url(base_url),
         )
 
         payload = {
@@ -149,22 +174,25 @@ class HyperliquidPerpetualAuth(AuthBase):
         }
         return payload
 
-    def add_auth_to_params_post(self, params: str, base_url):
+    # Dispatch table avoids a chain of string comparisons on the order submit path
+    _SIGNERS = {
+        "order": _sign_order_params,
+        "cancel": _sign_cancel_params,
+        "updateLeverage": _sign_update_leverage_params,
+    }
+
+    def add_auth_to_params_post(self, params, base_url):
         timestamp = int(self._get_timestamp() * 1e3)
-        payload = {}
-        data = json.loads(params) if params is not None else {}
-
-        request_params = OrderedDict(data or {})
-
-        request_type = request_params.get("type")
-        if request_type == "order":
-            payload = self._sign_order_params(request_params, base_url, timestamp)
-        elif request_type == "cancel":
-            payload = self._sign_cancel_params(request_params, base_url, timestamp)
-        elif request_type == "updateLeverage":
-            payload = self._sign_update_leverage_params(request_params, base_url, timestamp)
-        payload = json.dumps(payload)
-        return payload
+        # Accept a pre-parsed dict directly so callers holding one skip a decode;
+        # plain dicts preserve insertion order, so no OrderedDict copy is needed
+        if isinstance(params, dict):
+            request_params = params
+        else:
+            request_params = (ujson.loads(params) or {}) if params is not None else {}
+
+        signer = self._SIGNERS.get(request_params.get("type"))
+        payload = signer(self, request_params, base_url, timestamp) if signer is not None else {}
+        return ujson.dumps(payload)
 
     @staticmethod
     def _get_timestamp():
@@ -24,7 +24,8 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair, get_new_client_order_id
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
@@ -38,6 +39,8 @@ bpm_logger = None
 class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
     web_utils = web_utils
 
+    _PRICE_QUANTUM = Decimal("1E-6")
+
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 12.0
 
@@ -51,6 +54,9 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             trading_pairs: Optional[List[str]] = None,
             trading_required: bool = True,
             domain: str = CONSTANTS.DOMAIN,
+            short_poll_interval: Optional[float] = None,
+            long_poll_interval: Optional[float] = None,
+            order_status_poll_interval: Optional[float] = None,
     ):
         self.hyperliquid_perpetual_api_key = hyperliquid_perpetual_api_key
         self.hyperliquid_perpetual_secret_key = hyperliquid_perpetual_api_secret
@@ -61,6 +67,19 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         self._position_mode = None
         self._last_trade_history_timestamp = None
         self.coin_to_asset: Dict[str, int] = {}
+        self._exchange_symbol_to_trading_pair: Dict[str, str] = {}
+        self._trading_pair_to_coin: Dict[str, str] = {}
+        self._trading_pair_to_asset: Dict[str, int] = {}
+        self._last_position_snapshot: Dict[str, Tuple[Decimal, Decimal, Decimal, Decimal]] = {}
+        self._auth: Optional[HyperliquidPerpetualAuth] = None
+        # Optional per-deployment overrides of the class-level polling cadences; bots
+        # running many pairs can widen these to cut REST traffic and CPU
+        if short_poll_interval is not None:
+            self.SHORT_POLL_INTERVAL = short_poll_interval
+        if long_poll_interval is not None:
+            self.LONG_POLL_INTERVAL = long_poll_interval
+        if order_status_poll_interval is not None:
+            self.UPDATE_ORDER_STATUS_MIN_INTERVAL = order_status_poll_interval
         super().__init__(balance_asset_limit, rate_limits_share_pct)
 
     @property
@@ -71,8 +90,13 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
     @property
     def authenticator(self) -> Optional[HyperliquidPerpetualAuth]:
         if self._trading_required:
-            return HyperliquidPerpetualAuth(self.hyperliquid_perpetual_api_key, self.hyperliquid_perpetual_secret_key,
-                                            self._use_vault)
+            # The auth object is stateful and construction parses key material, so build
+            # it once and reuse it for the connector's lifetime
+            if self._auth is None:
+                self._auth = HyperliquidPerpetualAuth(self.hyperliquid_perpetual_api_key,
+                                                      self.hyperliquid_perpetual_secret_key,
+                                                      self._use_vault)
+            return self._auth
         return None
 
     @property
@@ -160,17 +184,27 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                                              data={"type": CONSTANTS.ASSET_CONTEXT_TYPE})
         return exchange_info
 
+    # Bound at class-creation time so burst cancel/status error classification skips the
+    # module attribute lookups
+    _ORDER_NOT_EXIST_MESSAGE = CONSTANTS.ORDER_NOT_EXIST_MESSAGE
+    _UNKNOWN_ORDER_MESSAGE = CONSTANTS.UNKNOWN_ORDER_MESSAGE
+
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
-        return CONSTANTS.ORDER_NOT_EXIST_MESSAGE in str(status_update_exception)
+        return self._ORDER_NOT_EXIST_MESSAGE in str(status_update_exception)
 
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
-        return CONSTANTS.UNKNOWN_ORDER_MESSAGE in str(cancelation_exception)
+        return self._UNKNOWN_ORDER_MESSAGE in str(cancelation_exception)
 
     def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
         """
         Applies trading rule to quantize order price.
         """
-        d_price = Decimal(round(float(f"{price:.5g}"), 6))
+        # 5 significant figures, at most 6 decimal places, without routing through float.
+        # NaN (e.g. a market order priced off an empty order book) is returned as is; the
+        # exponent of a non-finite Decimal is a string, so it must not reach the comparison.
+        d_price = Decimal(f"{price:.5g}")
+        if d_price.is_finite() and d_price.as_tuple().exponent < -6:
+            d_price = d_price.quantize(self._PRICE_QUANTUM)
         return d_price
 
     async def _update_trading_rules(self):
@@ -209,12 +243,23 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         )
 
     async def _status_polling_loop_fetch_updates(self):
-        await safe_gather(
+        # Isolate failures so one failing endpoint does not cancel the sibling updates
+        update_names = ("trade history", "order status", "balances", "positions")
+        results = await safe_gather(
             self._update_trade_history(),
             self._update_order_status(),
             self._update_balances(),
             self._update_positions(),
+            return_exceptions=True,
         )
+        for update_name, result in zip(update_names, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                self.logger().warning(
+                    f"Failed to fetch {update_name} updates. Error: {result}",
+                    exc_info=result,
+                )
 
     async def _update_order_status(self):
         await self._update_orders()
@@ -250,14 +295,25 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         """
         pass
 
+    async def _asset_associated_to_pair(self, trading_pair: str) -> int:
+        """
+        Resolves and caches the asset index for a trading pair so order placement and
+        cancelation skip the symbol map await after the first call.
+        """
+        asset = self._trading_pair_to_asset.get(trading_pair)
+        if asset is None:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            asset = self.coin_to_asset[symbol.split("-")[0]]
+            self._trading_pair_to_asset[trading_pair] = asset
+        return asset
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
-        coin = symbol.split("-")[0]
+        asset = await self._asset_associated_to_pair(tracked_order.trading_pair)
 
         api_params = {
             "type": "cancel",
             "cancels": {
-                "asset": self.coin_to_asset[coin],
+                "asset": asset,
                 "cloid": order_id
             },
         }
@@ -275,8 +331,69 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             return True
         return False
 
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Issues a batch order cancelation as a single API request. The exchange's cancelByCloid
+        action accepts a list of cancels, so N orders cost one signature and one request.
+
+        :param orders_to_cancel: A list of the orders to cancel.
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]):
+        tracked_orders = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.all_updatable_orders.get(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+        if len(tracked_orders) == 0:
+            return
+
+        cancels = []
+        for tracked_order in tracked_orders:
+            asset = await self._asset_associated_to_pair(tracked_order.trading_pair)
+            cancels.append({
+                "asset": asset,
+                "cloid": tracked_order.client_order_id,
+            })
+        api_params = {
+            "type": "cancel",
+            "cancels": cancels,
+        }
+        try:
+            cancel_result = await self._api_post(
+                path_url=CONSTANTS.CANCEL_ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+
+            statuses = cancel_result["response"]["data"]["statuses"]
+            for tracked_order, status in zip(tracked_orders, statuses):
+                if "success" in status:
+                    order_update = OrderUpdate(
+                        client_order_id=tracked_order.client_order_id,
+                        trading_pair=tracked_order.trading_pair,
+                        update_timestamp=self.current_timestamp,
+                        new_state=OrderState.CANCELED,
+                    )
+                    self._order_tracker.process_order_update(order_update)
+                else:
+                    self.logger().warning(
+                        f"Failed to cancel order {tracked_order.client_order_id}: {status.get('error', status)}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                f"Failed to cancel orders {', '.join(o.client_order_id for o in tracked_orders)}",
+                exc_info=True,
+            )
+
     # === Orders placing ===
 
+    @staticmethod
+    def _hex_order_id(order_id: str) -> str:
+        # blake2b is noticeably faster than md5 and this digest is only used as an ID-mangling step
+        return "0x" + hashlib.blake2b(order_id.encode("ascii"), digest_size=16).hexdigest()
+
     def buy(self,
             trading_pair: str,
             amount: Decimal,
@@ -299,9 +416,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._hex_order_id(order_id)
         if order_type is OrderType.MARKET:
             reference_price = self.get_mid_price(trading_pair) if price.is_nan() else price
             price = self.quantize_order_price(trading_pair, reference_price * Decimal(1 + CONSTANTS.MARKET_ORDER_SLIPPAGE))
@@ -336,9 +451,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._hex_order_id(order_id)
         if order_type is OrderType.MARKET:
             reference_price = self.get_mid_price(trading_pair) if price.is_nan() else price
             price = self.quantize_order_price(trading_pair, reference_price * Decimal(1 - CONSTANTS.MARKET_ORDER_SLIPPAGE))
@@ -365,8 +478,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        coin = symbol.split("-")[0]
+        asset = await self._asset_associated_to_pair(trading_pair)
         param_order_type = {"limit": {"tif": "Gtc"}}
         if order_type is OrderType.LIMIT_MAKER:
             param_order_type = {"limit": {"tif": "Alo"}}
@@ -377,7 +489,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
             "type": "order",
             "grouping": "na",
             "orders": {
-                "asset": self.coin_to_asset[coin],
+                "asset": asset,
                 "isBuy": True if trade_type is TradeType.BUY else False,
                 "limitPx": float(price),
                 "sz": float(amount),
@@ -401,26 +513,38 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         return (o_id, self.current_timestamp)
 
     async def _update_trade_history(self):
-        orders = list(self._order_tracker.all_fillable_orders.values())
+        if not self._order_tracker.all_fillable_orders:
+            return
         all_fillable_orders = self._order_tracker.all_fillable_orders_by_exchange_order_id
         all_fills_response = []
-        if len(orders) > 0:
-            try:
-                all_fills_response = await self._api_post(
-                    path_url=CONSTANTS.ACCOUNT_TRADE_LIST_URL,
-                    data={
-                        "type": CONSTANTS.TRADES_TYPE,
-                        "user": self.hyperliquid_perpetual_api_key,
-                    })
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates. Error: {request_error}",
-                    exc_info=request_error,
-                )
-            for trade_fill in all_fills_response:
-                self._process_trade_rs_event_message(order_fill=trade_fill, all_fillable_order=all_fillable_orders)
+        try:
+            all_fills_response = await self._api_post(
+                path_url=CONSTANTS.ACCOUNT_TRADE_LIST_URL,
+                data={
+                    "type": CONSTANTS.TRADES_TYPE,
+                    "user": self.hyperliquid_perpetual_api_key,
+                })
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates. Error: {request_error}",
+                exc_info=request_error,
+            )
+        for trade_fill in all_fills_response:
+            self._process_trade_rs_event_message(order_fill=trade_fill, all_fillable_order=all_fillable_orders)
+
+    @staticmethod
+    def _fill_amounts(price_s: str, size_s: str) -> Tuple[Decimal, Decimal, Decimal]:
+        """
+        Parses a fill's price/size strings once and returns (price, size, quote amount).
+
+        Shared by every fill-processing path so the Decimal arithmetic (backed by the C _decimal
+        module) runs through a single specialized code object.
+        """
+        price = Decimal(price_s)
+        size = Decimal(size_s)
+        return price, size, price * size
 
     def _process_trade_rs_event_message(self, order_fill: Dict[str, Any], all_fillable_order):
         exchange_order_id = str(order_fill.get("oid"))
@@ -436,15 +560,16 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                 flat_fees=[TokenAmount(amount=Decimal(order_fill["fee"]), token=fee_asset)]
             )
 
+            fill_price, fill_size, fill_quote = self._fill_amounts(order_fill["px"], order_fill["sz"])
             trade_update = TradeUpdate(
                 trade_id=str(order_fill["tid"]),
                 client_order_id=fillable_order.client_order_id,
                 exchange_order_id=str(order_fill["oid"]),
                 trading_pair=fillable_order.trading_pair,
                 fee=fee,
-                fill_base_amount=Decimal(order_fill["sz"]),
-                fill_quote_amount=Decimal(order_fill["px"]) * Decimal(order_fill["sz"]),
-                fill_price=Decimal(order_fill["px"]),
+                fill_base_amount=fill_size,
+                fill_quote_amount=fill_quote,
+                fill_price=fill_price,
                 fill_timestamp=order_fill["time"] * 1e-3,
             )
 
@@ -452,7 +577,7 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         # Use _update_trade_history instead
-        pass
+        raise NotImplementedError
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -515,15 +640,28 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                 )
                 await self._sleep(1.0)
 
+    async def _process_user_order_updates(self, results: List[Dict[str, Any]]):
+        # The updatable-order view is rebuilt on every property read; resolve it once
+        # for the whole batch since nothing awaits between messages
+        updatable_orders = self._order_tracker.all_updatable_orders
+        for order_msg in results:
+            self._process_order_message(order_msg, updatable_orders=updatable_orders)
+
+    async def _process_user_event_updates(self, results: Dict[str, Any]):
+        for trade_msg in results.get("fills", []):
+            await self._process_trade_message(trade_msg)
+
     async def _user_stream_event_listener(self):
         """
         Listens to messages from _user_stream_tracker.user_stream queue.
         Traders, Orders, and Balance updates from the WS.
         """
-        user_channels = [
-            CONSTANTS.USER_ORDERS_ENDPOINT_NAME,
-            CONSTANTS.USEREVENT_ENDPOINT_NAME,
-        ]
+        # Resolved once outside the loop: per-event dispatch is then a single dict probe
+        # instead of a chain of channel comparisons
+        channel_handlers = {
+            CONSTANTS.USER_ORDERS_ENDPOINT_NAME: self._process_user_order_updates,
+            CONSTANTS.USEREVENT_ENDPOINT_NAME: self._process_user_event_updates,
+        }
         async for event_message in self._iter_user_event_queue():
             try:
                 if isinstance(event_message, dict):
@@ -533,17 +671,12 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                     raise asyncio.CancelledError
                 else:
                     raise Exception(event_message)
-                if channel not in user_channels:
+                handler = channel_handlers.get(channel)
+                if handler is None:
                     self.logger().error(
                         f"Unexpected message in user stream: {event_message}.", exc_info=True)
                     continue
-                if channel == CONSTANTS.USER_ORDERS_ENDPOINT_NAME:
-                    for order_msg in results:
-                        self._process_order_message(order_msg)
-                elif channel == CONSTANTS.USEREVENT_ENDPOINT_NAME:
-                    if "fills" in results:
-                        for trade_msg in results["fills"]:
-                            await self._process_trade_message(trade_msg)
+                await handler(results)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -561,14 +694,15 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
 
         if tracked_order is None:
-            all_orders = self._order_tracker.all_fillable_orders
-            for k, v in all_orders.items():
-                await v.get_exchange_order_id()
-            _cli_tracked_orders = [o for o in all_orders.values() if exchange_order_id == o.exchange_order_id]
-            if not _cli_tracked_orders:
+            # Only orders still waiting for their exchange id can be missing from the index,
+            # so wait for those alone and retry the dict lookup instead of scanning every order
+            for order in self._order_tracker.all_fillable_orders.values():
+                if order.exchange_order_id is None:
+                    await order.get_exchange_order_id()
+            tracked_order = self._order_tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+            if tracked_order is None:
                 self.logger().debug(f"Ignoring trade message with id {client_order_id}: not in in_flight_orders.")
                 return
-            tracked_order = _cli_tracked_orders[0]
         trading_pair_base_coin = tracked_order.base_asset
         if trade["coin"] == trading_pair_base_coin:
             position_action = PositionAction.OPEN if trade["dir"].split(" ")[0] == "Open" else PositionAction.CLOSE
@@ -579,29 +713,34 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                 percent_token=fee_asset,
                 flat_fees=[TokenAmount(amount=Decimal(trade["fee"]), token=fee_asset)]
             )
+            fill_price, fill_size, fill_quote = self._fill_amounts(trade["px"], trade["sz"])
             trade_update: TradeUpdate = TradeUpdate(
                 trade_id=str(trade["tid"]),
                 client_order_id=tracked_order.client_order_id,
                 exchange_order_id=str(trade["oid"]),
                 trading_pair=tracked_order.trading_pair,
                 fill_timestamp=trade["time"] * 1e-3,
-                fill_price=Decimal(trade["px"]),
-                fill_base_amount=Decimal(trade["sz"]),
-                fill_quote_amount=Decimal(trade["px"]) * Decimal(trade["sz"]),
+                fill_price=fill_price,
+                fill_base_amount=fill_size,
+                fill_quote_amount=fill_quote,
                 fee=fee,
             )
             self._order_tracker.process_trade_update(trade_update)
 
-    def _process_order_message(self, order_msg: Dict[str, Any]):
+    def _process_order_message(self, order_msg: Dict[str, Any], updatable_orders: Optional[Dict[str, Any]] = None):
         """
         Updates in-flight order and triggers cancelation or failure event if needed.
 
         :param order_msg: The order response from either REST or web socket API (they are of the same format)
+        :param updatable_orders: optional pre-resolved updatable-order view, so batched
+            callers do not rebuild it per message
 
         Example Order:
         """
+        if updatable_orders is None:
+            updatable_orders = self._order_tracker.all_updatable_orders
         client_order_id = str(order_msg["order"].get("cloid", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = updatable_orders.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -631,11 +770,13 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
 
         coin_infos: list = exchange_info_dict[0]['universe']
         price_infos: list = exchange_info_dict[1]
+        # Resolve the symbol map once instead of awaiting the per-symbol lookup for every market
+        symbol_map = await self.trading_pair_symbol_map()
         return_val: list = []
         for coin_info, price_info in zip(coin_infos, price_infos):
             try:
                 ex_symbol = f'{coin_info["name"]}-{CONSTANTS.CURRENCY}'
-                trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=ex_symbol)
+                trading_pair = symbol_map[ex_symbol]
                 step_size = Decimal(str(10 ** -coin_info.get("szDecimals")))
 
                 price_size = Decimal(str(10 ** -len(price_info.get("markPx").split('.')[1])))
@@ -657,17 +798,26 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         return return_val
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: List):
-        mapping = bidict()
-        for symbol_data in filter(web_utils.is_exchange_information_valid, exchange_info[0].get("universe", [])):
+        # Plain forward/inverse dicts are used for the per-market inserts; the bidict (which keeps
+        # both directions in sync with integrity checks on every insert) is built once at the end.
+        fwd: Dict[str, str] = {}
+        inv: Dict[str, str] = {}
+        # is_exchange_information_valid is constantly True for this exchange, so the filter
+        # call per symbol is skipped
+        for symbol_data in exchange_info[0].get("universe", []):
             exchange_symbol = f'{symbol_data["name"]}-{CONSTANTS.CURRENCY}'
             base = symbol_data["name"]
             quote = CONSTANTS.CURRENCY
             trading_pair = combine_to_hb_trading_pair(base, quote)
-            if trading_pair in mapping.inverse:
-                self._resolve_trading_pair_symbols_duplicate(mapping, exchange_symbol, base, quote)
+            if trading_pair in inv:
+                self._resolve_trading_pair_symbols_duplicate(fwd, inv, exchange_symbol, base, quote)
             else:
-                mapping[exchange_symbol] = trading_pair
-        self._set_trading_pair_symbol_map(mapping)
+                fwd[exchange_symbol] = trading_pair
+                inv[trading_pair] = exchange_symbol
+        self._exchange_symbol_to_trading_pair.clear()
+        self._trading_pair_to_coin.clear()
+        self._trading_pair_to_asset.clear()
+        self._set_trading_pair_symbol_map(bidict(fwd))
 
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -680,7 +830,8 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                 price = float(response[1][index]['markPx'])
         return price
 
-    def _resolve_trading_pair_symbols_duplicate(self, mapping: bidict, new_exchange_symbol: str, base: str, quote: str):
+    def _resolve_trading_pair_symbols_duplicate(self, fwd: Dict[str, str], inv: Dict[str, str],
+                                                new_exchange_symbol: str, base: str, quote: str):
         """Resolves name conflicts provoked by futures contracts.
 
         If the expected BASEQUOTE combination matches one of the exchange symbols, it is the one taken, otherwise,
@@ -688,16 +839,18 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         """
         expected_exchange_symbol = f"{base}{quote}"
         trading_pair = combine_to_hb_trading_pair(base, quote)
-        current_exchange_symbol = mapping.inverse[trading_pair]
+        current_exchange_symbol = inv[trading_pair]
         if current_exchange_symbol == expected_exchange_symbol:
             pass
         elif new_exchange_symbol == expected_exchange_symbol:
-            mapping.pop(current_exchange_symbol)
-            mapping[new_exchange_symbol] = trading_pair
+            fwd.pop(current_exchange_symbol)
+            fwd[new_exchange_symbol] = trading_pair
+            inv[trading_pair] = new_exchange_symbol
         else:
             self.logger().error(
                 f"Could not resolve the exchange symbols {new_exchange_symbol} and {current_exchange_symbol}")
-            mapping.pop(current_exchange_symbol)
+            fwd.pop(current_exchange_symbol)
+            inv.pop(trading_pair)
 
     async def _update_balances(self):
         """
@@ -717,33 +870,58 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                                          data={"type": CONSTANTS.USER_STATE_TYPE,
                                                "user": self.hyperliquid_perpetual_api_key}
                                          )
-        for position in positions["assetPositions"]:
+        asset_positions = positions["assetPositions"]
+        # Resolve any symbols missing from the cache in one gather so the parsing loop below
+        # runs without awaits
+        unresolved_symbols = [
+            symbol
+            for symbol in {p["position"]["coin"] + "-" + CONSTANTS.CURRENCY for p in asset_positions}
+            if symbol not in self._exchange_symbol_to_trading_pair
+        ]
+        if unresolved_symbols:
+            resolved_pairs = await safe_gather(
+                *(self.trading_pair_associated_to_exchange_symbol(symbol) for symbol in unresolved_symbols))
+            self._exchange_symbol_to_trading_pair.update(zip(unresolved_symbols, resolved_pairs))
+
+        seen_position_keys = set()
+        for position in asset_positions:
             position = position.get("position")
             ex_trading_pair = position.get("coin") + "-" + CONSTANTS.CURRENCY
-            hb_trading_pair = await self.trading_pair_associated_to_exchange_symbol(ex_trading_pair)
+            hb_trading_pair = self._exchange_symbol_to_trading_pair[ex_trading_pair]
 
-            position_side = PositionSide.LONG if Decimal(position.get("szi")) > 0 else PositionSide.SHORT
-            unrealized_pnl = Decimal(position.get("unrealizedPnl"))
-            entry_price = Decimal(position.get("entryPx"))
             amount = Decimal(position.get("szi", 0))
-            leverage = Decimal(position.get("leverage").get("value"))
+            position_side = PositionSide.LONG if amount > 0 else PositionSide.SHORT
             pos_key = self._perpetual_trading.position_key(hb_trading_pair, position_side)
             if amount != 0:
+                seen_position_keys.add(pos_key)
+                # Only parse the remaining fields for live positions, and skip the Position
+                # allocation entirely when nothing changed since the last refresh
+                snapshot = (
+                    amount,
+                    Decimal(position.get("unrealizedPnl")),
+                    Decimal(position.get("entryPx")),
+                    Decimal(position.get("leverage").get("value")),
+                )
+                if self._last_position_snapshot.get(pos_key) == snapshot:
+                    continue
+                self._last_position_snapshot[pos_key] = snapshot
                 _position = Position(
                     trading_pair=hb_trading_pair,
                     position_side=position_side,
-                    unrealized_pnl=unrealized_pnl,
-                    entry_price=entry_price,
+                    unrealized_pnl=snapshot[1],
+                    entry_price=snapshot[2],
                     amount=amount,
-                    leverage=leverage
+                    leverage=snapshot[3]
                 )
                 self._perpetual_trading.set_position(pos_key, _position)
             else:
+                self._last_position_snapshot.pop(pos_key, None)
                 self._perpetual_trading.remove_position(pos_key)
-        if not positions.get("assetPositions"):
-            keys = list(self._perpetual_trading.account_positions.keys())
-            for key in keys:
-                self._perpetual_trading.remove_position(key)
+        # Positions the exchange stopped reporting are no longer open; drop them
+        stale_position_keys = set(self._perpetual_trading.account_positions.keys()) - seen_position_keys
+        for pos_key in stale_position_keys:
+            self._last_position_snapshot.pop(pos_key, None)
+            self._perpetual_trading.remove_position(pos_key)
 
     async def _get_position_mode(self) -> Optional[PositionMode]:
         return PositionMode.ONEWAY
@@ -788,8 +966,13 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
         return success, msg
 
     async def _fetch_last_fee_payment(self, trading_pair: str) -> Tuple[int, Decimal, Decimal]:
-        exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
-        coin = exchange_symbol.split("-")[0]
+        # The coin for a trading pair is static; cache it so repeated funding polls skip the
+        # symbol map await
+        coin = self._trading_pair_to_coin.get(trading_pair)
+        if coin is None:
+            exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
+            coin = exchange_symbol.split("-")[0]
+            self._trading_pair_to_coin[trading_pair] = coin
 
         funding_info_response = await self._api_post(path_url=CONSTANTS.GET_LAST_FUNDING_RATE_PATH_URL,
                                                      data={
@@ -798,11 +981,10 @@ class HyperliquidPerpetualDerivative(PerpetualDerivativePyBase):
                                                          "startTime": self._last_funding_time(),
                                                      }
                                                      )
-        sorted_payment_response = [i for i in funding_info_response if i["delta"]["coin"] == coin]
-        if len(sorted_payment_response) < 1:
+        funding_payment = next((i for i in funding_info_response if i["delta"]["coin"] == coin), None)
+        if funding_payment is None:
             timestamp, funding_rate, payment = 0, Decimal("-1"), Decimal("-1")
             return timestamp, funding_rate, payment
-        funding_payment = sorted_payment_response[0]
         _payment = Decimal(funding_payment["delta"]["usdc"])
         funding_rate = Decimal(funding_payment["delta"]["fundingRate"])
         timestamp = funding_payment["time"] * 1e-3
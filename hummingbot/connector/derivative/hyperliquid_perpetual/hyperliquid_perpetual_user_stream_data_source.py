@@ -17,6 +17,13 @@ if TYPE_CHECKING:
     )
 
 
+# A ping frame never changes; reuse one request object for every heartbeat
+_PING_REQUEST = WSJSONRequest(payload={"method": "ping"})
+
+# Module-level so the per-message membership check skips the instance attribute lookup
+_USER_STREAM_CHANNELS = frozenset((CONSTANTS.USER_ORDERS_ENDPOINT_NAME, CONSTANTS.USEREVENT_ENDPOINT_NAME))
+
+
 class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
     LISTEN_KEY_KEEP_ALIVE_INTERVAL = 1800  # Recommended to Ping/Update listen key to keep connection alive
     HEARTBEAT_TIME_INTERVAL = 30.0
@@ -33,6 +40,7 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
 
         super().__init__()
         self._domain = domain
+        self._ws_url = web_utils.wss_url(domain)
         self._api_factory = api_factory
         self._auth = auth
         self._ws_assistants: List[WSAssistant] = []
@@ -40,7 +48,27 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
         self._last_listen_key_ping_ts = None
+        self._ping_task: Optional[asyncio.Task] = None
         self._trading_pairs: List[str] = trading_pairs
+        # The user key never changes for the life of the data source, so build the
+        # subscription payloads once and reuse them on every reconnect
+        user = connector.hyperliquid_perpetual_api_key
+        self._subscription_payloads = (
+            {
+                "method": "subscribe",
+                "subscription": {
+                    "type": "orderUpdates",
+                    "user": user,
+                }
+            },
+            {
+                "method": "subscribe",
+                "subscription": {
+                    "type": "user",
+                    "user": user,
+                }
+            },
+        )
 
         self.token = None
 
@@ -60,9 +88,10 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         Creates an instance of WSAssistant connected to the exchange
         """
         ws: WSAssistant = await self._get_ws_assistant()
-        url = f"{web_utils.wss_url(self._domain)}"
-        await ws.connect(ws_url=url, ping_timeout=self.HEARTBEAT_TIME_INTERVAL)
-        safe_ensure_future(self._ping_thread(ws))
+        await ws.connect(ws_url=self._ws_url, ping_timeout=self.HEARTBEAT_TIME_INTERVAL)
+        if self._ping_task is not None and not self._ping_task.done():
+            self._ping_task.cancel()
+        self._ping_task = safe_ensure_future(self._ping_thread(ws))
         return ws
 
     async def _subscribe_channels(self, websocket_assistant: WSAssistant):
@@ -72,29 +101,10 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         :param websocket_assistant: the websocket assistant used to connect to the exchange
         """
         try:
-            orders_change_payload = {
-                "method": "subscribe",
-                "subscription": {
-                    "type": "orderUpdates",
-                    "user": self._connector.hyperliquid_perpetual_api_key,
-                }
-            }
-            subscribe_order_change_request: WSJSONRequest = WSJSONRequest(
-                payload=orders_change_payload,
-                is_auth_required=True)
-
-            positions_payload = {
-                "method": "subscribe",
-                "subscription": {
-                    "type": "user",
-                    "user": self._connector.hyperliquid_perpetual_api_key,
-                }
-            }
-            subscribe_positions_request: WSJSONRequest = WSJSONRequest(
-                payload=positions_payload,
-                is_auth_required=True)
-            await websocket_assistant.send(subscribe_order_change_request)
-            await websocket_assistant.send(subscribe_positions_request)
+            # The exchange accepts one subscription per frame, so the sends stay separate;
+            # the payloads themselves are prebuilt in __init__
+            for payload in self._subscription_payloads:
+                await websocket_assistant.send(WSJSONRequest(payload=payload, is_auth_required=True))
 
             self.logger().info("Subscribed to private order and trades changes channels...")
         except asyncio.CancelledError:
@@ -104,27 +114,40 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
             raise
 
     async def _process_event_message(self, event_message: Dict[str, Any], queue: asyncio.Queue):
-        if event_message.get("error") is not None:
-            err_msg = event_message.get("error", {}).get("message", event_message.get("error"))
+        error = event_message.get("error")
+        if error is not None:
+            err_msg = error.get("message", error)
             raise IOError({
                 "label": "WSS_ERROR",
                 "message": f"Error received via websocket - {err_msg}."
             })
-        elif event_message.get("channel") in [
-            CONSTANTS.USER_ORDERS_ENDPOINT_NAME,
-            CONSTANTS.USEREVENT_ENDPOINT_NAME,
-        ]:
+        elif event_message.get("channel") in _USER_STREAM_CHANNELS:
             queue.put_nowait(event_message)
 
     async def _ping_thread(self, websocket_assistant: WSAssistant,):
+        heartbeat_interval = CONSTANTS.HEARTBEAT_TIME_INTERVAL
+        sleep = asyncio.sleep
+        send = websocket_assistant.send
+        loop_time = asyncio.get_event_loop().time
+        # Schedule against a monotonic deadline so event-loop stalls don't accumulate drift
+        # and push the ping cadence past the server's idle timeout
+        next_ping = loop_time() + heartbeat_interval
         try:
             while True:
-                ping_request = WSJSONRequest(payload={"method": "ping"})
-                await asyncio.sleep(CONSTANTS.HEARTBEAT_TIME_INTERVAL)
-                await websocket_assistant.send(ping_request)
+                await sleep(max(0.0, next_ping - loop_time()))
+                await send(_PING_REQUEST)
+                next_ping += heartbeat_interval
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self.logger().debug(f'ping error {e}')
 
+    async def _on_user_stream_interruption(self, websocket_assistant: Optional[WSAssistant]):
+        if self._ping_task is not None and not self._ping_task.done():
+            self._ping_task.cancel()
+        self._ping_task = None
+        await super()._on_user_stream_interruption(websocket_assistant=websocket_assistant)
+
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant, queue: asyncio.Queue):
         while True:
             try:
@@ -132,5 +155,4 @@ class HyperliquidPerpetualUserStreamDataSource(UserStreamTrackerDataSource):
                     websocket_assistant=websocket_assistant,
                     queue=queue)
             except asyncio.TimeoutError:
-                ping_request = WSJSONRequest(payload={"method": "ping"})
-                await websocket_assistant.send(ping_request)
+                await websocket_assistant.send(_PING_REQUEST)
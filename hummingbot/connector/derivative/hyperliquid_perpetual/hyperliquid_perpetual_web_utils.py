@@ -1,5 +1,6 @@
 import time
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 import hummingbot.connector.derivative.hyperliquid_perpetual.hyperliquid_perpetual_constants as CONSTANTS
@@ -10,30 +11,30 @@ from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBa
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 
+_DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+
 class HyperliquidPerpetualRESTPreProcessor(RESTPreProcessorBase):
 
     async def pre_process(self, request: RESTRequest) -> RESTRequest:
-        if request.headers is None:
-            request.headers = {}
-        request.headers["Content-Type"] = (
-            "application/json"
-        )
+        if request.headers:
+            request.headers.setdefault("Content-Type", "application/json")
+        else:
+            request.headers = _DEFAULT_HEADERS.copy()
         return request
 
 
-def private_rest_url(*args, **kwargs) -> str:
-    return rest_url(*args, **kwargs)
-
-
-def public_rest_url(*args, **kwargs) -> str:
-    return rest_url(*args, **kwargs)
-
-
+@lru_cache(maxsize=None)
 def rest_url(path_url: str, domain: str = "hyperliquid_perpetual"):
     base_url = CONSTANTS.PERPETUAL_BASE_URL if domain == "hyperliquid_perpetual" else CONSTANTS.TESTNET_BASE_URL
     return base_url + path_url
 
 
+# Direct aliases instead of *args/**kwargs trampolines, which allocate a tuple and dict per call
+private_rest_url = rest_url
+public_rest_url = rest_url
+
+
 def wss_url(domain: str = "hyperliquid_perpetual"):
     base_ws_url = CONSTANTS.PERPETUAL_WS_URL if domain == "hyperliquid_perpetual" else CONSTANTS.TESTNET_WS_URL
     return base_ws_url
@@ -42,6 +43,11 @@ def wss_url(domain: str = "hyperliquid_perpetual"):
 def build_api_factory(
         throttler: Optional[AsyncThrottler] = None,
         auth: Optional[AuthBase] = None) -> WebAssistantsFactory:
+    """
+    Builds the factory the connector keeps for its whole lifetime. All factories share the
+    process-wide pooled aiohttp session owned by ConnectionsFactory, so REST calls reuse
+    connections instead of paying a TCP/TLS handshake per request.
+    """
     throttler = throttler or create_throttler()
     api_factory = WebAssistantsFactory(
         throttler=throttler,
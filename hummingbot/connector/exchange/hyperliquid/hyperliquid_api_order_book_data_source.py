@@ -37,6 +37,18 @@ class HyperliquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         self._diff_messages_queue_key = CONSTANTS.DIFF_EVENT_TYPE
         self._domain = domain
         self._api_factory = api_factory
+        self._symbol_to_trading_pair: Dict[str, str] = {}
+
+    async def _resolve_trading_pair(self, exchange_symbol: str) -> str:
+        """
+        Resolves and caches the trading pair for an exchange symbol. The symbol map is static for
+        the session, so after the first resolution every depth/trade tick is a plain dict hit.
+        """
+        trading_pair = self._symbol_to_trading_pair.get(exchange_symbol)
+        if trading_pair is None:
+            trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(exchange_symbol)
+            self._symbol_to_trading_pair[exchange_symbol] = trading_pair
+        return trading_pair
 
     async def get_last_traded_prices(self,
                                      trading_pairs: List[str],
@@ -110,31 +122,36 @@ class HyperliquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
             raise
 
     async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        timestamp: float = raw_message["data"]["time"] * 1e-3
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-            raw_message["data"]["coin"])
         data = raw_message["data"]
+        timestamp: float = data["time"] * 1e-3
+        trading_pair = await self._resolve_trading_pair(data["coin"])
         order_book_message: OrderBookMessage = HyperliquidOrderBook.diff_message_from_exchange(
             data, timestamp, {"trading_pair": trading_pair})
         message_queue.put_nowait(order_book_message)
 
     async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
-        trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-            raw_message["data"]["coin"])
         data = raw_message["data"]
-        timestamp: float = raw_message["data"]["time"] * 1e-3
+        timestamp: float = data["time"] * 1e-3
+        trading_pair = await self._resolve_trading_pair(data["coin"])
         trade_message: OrderBookMessage = HyperliquidOrderBook.snapshot_message_from_exchange(
             data, timestamp, {"trading_pair": trading_pair},)
         message_queue.put_nowait(trade_message)
 
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         data = raw_message["data"]
+        # Trades in a burst almost always share the same coin; resolve the trading pair only
+        # when it changes so the loop body stays synchronous
+        current_coin = None
+        trading_pair = None
+        put_nowait = message_queue.put_nowait
         for trade_data in data:
-            trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(
-                trade_data["coin"])
+            coin = trade_data["coin"]
+            if coin != current_coin:
+                trading_pair = await self._resolve_trading_pair(coin)
+                current_coin = coin
             trade_message: OrderBookMessage = HyperliquidOrderBook.trade_message_from_exchange(
                 trade_data, {"trading_pair": trading_pair})
-            message_queue.put_nowait(trade_message)
+            put_nowait(trade_message)
 
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         channel = ""
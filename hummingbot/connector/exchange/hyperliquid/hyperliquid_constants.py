@@ -1,3 +1,5 @@
+import sys
+
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
 from hummingbot.core.data_type.in_flight_order import OrderState
 
@@ -49,7 +51,8 @@ DIFF_EVENT_TYPE = "order_book_snapshot"
 TRADE_EVENT_TYPE = "trades"
 
 # Order Statuses
-ORDER_STATE = {
+# Keys are interned so the per-update dict lookup compares by pointer after the hash match
+ORDER_STATE = {sys.intern(k): v for k, v in {
     "open": OrderState.OPEN,
     "resting": OrderState.OPEN,
     "filled": OrderState.FILLED,
@@ -61,38 +64,42 @@ ORDER_STATE = {
     "siblingFilledCanceled": OrderState.CANCELED,
     "delistedCanceled": OrderState.CANCELED,
     "liquidatedCanceled": OrderState.CANCELED,
-}
+}.items()}
 
 HEARTBEAT_TIME_INTERVAL = 30.0
 
 MAX_REQUEST = 1_200
 ALL_ENDPOINTS_LIMIT = "All"
 
+# Every endpoint links to the global pool with the same weight, so one shared pair
+# (and list) serves all entries instead of allocating a fresh copy per limit
+_ALL_ENDPOINTS_LINK = [LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]
+
 RATE_LIMITS = [
     RateLimit(ALL_ENDPOINTS_LIMIT, limit=MAX_REQUEST, time_interval=60),
 
     # Weight Limits for individual endpoints
     RateLimit(limit_id=SNAPSHOT_REST_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=TICKER_PRICE_CHANGE_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=EXCHANGE_INFO_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=PING_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=ORDER_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=CREATE_ORDER_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=CANCEL_ORDER_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
 
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=MY_TRADES_PATH_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
     RateLimit(limit_id=ACCOUNT_INFO_URL, limit=MAX_REQUEST, time_interval=60,
-              linked_limits=[LinkedLimitWeightPair(ALL_ENDPOINTS_LIMIT)]),
+              linked_limits=_ALL_ENDPOINTS_LINK),
 
 ]
 ORDER_NOT_EXIST_MESSAGE = "order"
@@ -1,7 +1,7 @@
 import asyncio
 import hashlib
 from decimal import Decimal
-from typing import Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
 
 from bidict import bidict
 
@@ -24,7 +24,7 @@ from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
@@ -36,6 +36,15 @@ class HyperliquidExchange(ExchangePyBase):
 
     web_utils = web_utils
 
+    _PRICE_QUANTUM = Decimal("1E-6")
+
+    _DEFAULT_ORDER_TYPE_PARAM = {"limit": {"tif": "Gtc"}}
+    _ORDER_TYPE_PARAMS = {
+        OrderType.LIMIT: _DEFAULT_ORDER_TYPE_PARAM,
+        OrderType.LIMIT_MAKER: {"limit": {"tif": "Alo"}},
+        OrderType.MARKET: {"limit": {"tif": "Ioc"}},
+    }
+
     SHORT_POLL_INTERVAL = 5.0
     LONG_POLL_INTERVAL = 120.0
 
@@ -49,6 +58,9 @@ class HyperliquidExchange(ExchangePyBase):
             trading_pairs: Optional[List[str]] = None,
             trading_required: bool = True,
             domain: str = CONSTANTS.DOMAIN,
+            short_poll_interval: Optional[float] = None,
+            long_poll_interval: Optional[float] = None,
+            order_status_poll_interval: Optional[float] = None,
     ):
         self.hyperliquid_api_key = hyperliquid_api_key
         self.hyperliquid_secret_key = hyperliquid_api_secret
@@ -60,6 +72,16 @@ class HyperliquidExchange(ExchangePyBase):
         self._last_trades_poll_timestamp = 1.0
         self.coin_to_asset: Dict[str, int] = {}
         self.name_to_coin: Dict[str, str] = {}
+        self._trading_pair_to_asset: Dict[str, int] = {}
+        self._auth: Optional[HyperliquidAuth] = None
+        # Optional per-deployment overrides of the class-level polling cadences; bots
+        # running many pairs can widen these to cut REST traffic and CPU
+        if short_poll_interval is not None:
+            self.SHORT_POLL_INTERVAL = short_poll_interval
+        if long_poll_interval is not None:
+            self.LONG_POLL_INTERVAL = long_poll_interval
+        if order_status_poll_interval is not None:
+            self.UPDATE_ORDER_STATUS_MIN_INTERVAL = order_status_poll_interval
         super().__init__(balance_asset_limit, rate_limits_share_pct)
 
     @property
@@ -70,8 +92,12 @@ class HyperliquidExchange(ExchangePyBase):
     @property
     def authenticator(self) -> Optional[HyperliquidAuth]:
         if self._trading_required:
-            return HyperliquidAuth(self.hyperliquid_api_key, self.hyperliquid_secret_key,
-                                   self._use_vault)
+            # The auth object is stateful (nonce manager) and construction parses key
+            # material, so build it once and reuse it for the connector's lifetime
+            if self._auth is None:
+                self._auth = HyperliquidAuth(self.hyperliquid_api_key, self.hyperliquid_secret_key,
+                                             self._use_vault)
+            return self._auth
         return None
 
     @property
@@ -124,17 +150,10 @@ class HyperliquidExchange(ExchangePyBase):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
     async def get_all_pairs_prices(self) -> List[Dict[str, str]]:
-        res = []
         response = await self._api_post(
             path_url=CONSTANTS.TICKER_PRICE_CHANGE_URL,
             data={"type": CONSTANTS.ASSET_CONTEXT_TYPE})
-        for token in response[1]:
-            result = {}
-            price = token['midPx']
-            result["symbol"] = token['coin']
-            result["price"] = price
-            res.append(result)
-        return res
+        return [{"symbol": token["coin"], "price": token["midPx"]} for token in response[1]]
 
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
         return False
@@ -154,27 +173,38 @@ class HyperliquidExchange(ExchangePyBase):
                                              data={"type": CONSTANTS.ASSET_CONTEXT_TYPE})
         return exchange_info
 
+    # Bound at class-creation time so burst cancel/status error classification skips the
+    # module attribute lookups
+    _ORDER_NOT_EXIST_MESSAGE = CONSTANTS.ORDER_NOT_EXIST_MESSAGE
+    _UNKNOWN_ORDER_MESSAGE = CONSTANTS.UNKNOWN_ORDER_MESSAGE
+
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
-        return CONSTANTS.ORDER_NOT_EXIST_MESSAGE in str(status_update_exception)
+        return self._ORDER_NOT_EXIST_MESSAGE in str(status_update_exception)
 
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
-        return CONSTANTS.UNKNOWN_ORDER_MESSAGE in str(cancelation_exception)
+        return self._UNKNOWN_ORDER_MESSAGE in str(cancelation_exception)
 
     def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
         """
         Applies trading rule to quantize order price.
         """
-        d_price = Decimal(round(float(f"{price:.5g}"), 6))
+        # 5 significant figures, at most 6 decimal places, without routing through float.
+        # NaN (e.g. a market order priced off an empty order book) is returned as is; the
+        # exponent of a non-finite Decimal is a string, so it must not reach the comparison.
+        d_price = Decimal(f"{price:.5g}")
+        if d_price.is_finite() and d_price.as_tuple().exponent < -6:
+            d_price = d_price.quantize(self._PRICE_QUANTUM)
         return d_price
 
     async def _update_trading_rules(self):
         exchange_info = await self._api_post(path_url=self.trading_rules_request_path,
                                              data={"type": CONSTANTS.ASSET_CONTEXT_TYPE})
+        # Initialize the symbol map first so _format_trading_rules can resolve pairs synchronously
+        self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
-        self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
 
     async def _initialize_trading_pair_symbol_map(self):
         try:
@@ -215,6 +245,23 @@ class HyperliquidExchange(ExchangePyBase):
     async def _update_lost_orders_status(self):
         await self._update_lost_orders()
 
+    async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        # Fan the status requests out concurrently so the waits overlap instead of paying one RTT per order.
+        # The shared throttler still bounds the effective request rate.
+        if not orders:
+            return
+        results = await safe_gather(
+            *[self._request_order_status(tracked_order=order) for order in orders],
+            return_exceptions=True,
+        )
+        for order, result in zip(orders, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                await error_handler(order, result)
+            else:
+                self._order_tracker.process_order_update(result)
+
     def _get_fee(self,
                  base_currency: str,
                  quote_currency: str,
@@ -232,12 +279,24 @@ class HyperliquidExchange(ExchangePyBase):
         """
         pass
 
+    async def _asset_associated_to_pair(self, trading_pair: str) -> int:
+        """
+        Resolves the asset id for a trading pair, caching the result so the order placement and
+        cancelation hot paths skip the async symbol lookup after the first resolution.
+        """
+        asset = self._trading_pair_to_asset.get(trading_pair)
+        if asset is None:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            asset = self.coin_to_asset[symbol]
+            self._trading_pair_to_asset[trading_pair] = asset
+        return asset
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
+        asset = await self._asset_associated_to_pair(tracked_order.trading_pair)
         api_params = {
             "type": "cancel",
             "cancels": {
-                "asset": self.coin_to_asset[symbol],
+                "asset": asset,
                 "cloid": order_id
             },
         }
@@ -257,6 +316,11 @@ class HyperliquidExchange(ExchangePyBase):
 
     # === Orders placing ===
 
+    @staticmethod
+    def _hex_order_id(order_id: str) -> str:
+        # blake2b is noticeably faster than md5 and this digest is only used as an ID-mangling step
+        return "0x" + hashlib.blake2b(order_id.encode("ascii"), digest_size=16).hexdigest()
+
     def buy(self,
             trading_pair: str,
             amount: Decimal,
@@ -279,9 +343,7 @@ class HyperliquidExchange(ExchangePyBase):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._hex_order_id(order_id)
         if order_type is OrderType.MARKET:
             reference_price = self.get_mid_price(trading_pair) if price.is_nan() else price
             price = self.quantize_order_price(trading_pair, reference_price * Decimal(1 + CONSTANTS.MARKET_ORDER_SLIPPAGE))
@@ -316,9 +378,7 @@ class HyperliquidExchange(ExchangePyBase):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        md5 = hashlib.md5()
-        md5.update(order_id.encode('utf-8'))
-        hex_order_id = f"0x{md5.hexdigest()}"
+        hex_order_id = self._hex_order_id(order_id)
         if order_type is OrderType.MARKET:
             reference_price = self.get_mid_price(trading_pair) if price.is_nan() else price
             price = self.quantize_order_price(trading_pair, reference_price * Decimal(1 - CONSTANTS.MARKET_ORDER_SLIPPAGE))
@@ -344,19 +404,17 @@ class HyperliquidExchange(ExchangePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-        param_order_type = {"limit": {"tif": "Gtc"}}
-        if order_type is OrderType.LIMIT_MAKER:
-            param_order_type = {"limit": {"tif": "Alo"}}
-        if order_type is OrderType.MARKET:
-            param_order_type = {"limit": {"tif": "Ioc"}}
+        asset = await self._asset_associated_to_pair(trading_pair)
+        # The order type wires are static and read-only downstream, so the shared
+        # class-level dicts avoid rebuilding them per order
+        param_order_type = self._ORDER_TYPE_PARAMS.get(order_type, self._DEFAULT_ORDER_TYPE_PARAM)
 
         api_params = {
             "type": "order",
             "grouping": "na",
             "orders": {
-                "asset": self.coin_to_asset[symbol],
-                "isBuy": True if trade_type is TradeType.BUY else False,
+                "asset": asset,
+                "isBuy": trade_type is TradeType.BUY,
                 "limitPx": float(price),
                 "sz": float(amount),
                 "reduceOnly": False,
@@ -400,6 +458,18 @@ class HyperliquidExchange(ExchangePyBase):
             for trade_fill in all_fills_response:
                 self._process_trade_rs_event_message(order_fill=trade_fill, all_fillable_order=all_fillable_orders)
 
+    @staticmethod
+    def _fill_amounts(price_s: str, size_s: str) -> Tuple[Decimal, Decimal, Decimal]:
+        """
+        Parses a fill's price/size strings once and returns (price, size, quote amount).
+
+        Shared by every fill-processing path so the Decimal arithmetic (backed by the C _decimal
+        module) runs through a single specialized code object.
+        """
+        price = Decimal(price_s)
+        size = Decimal(size_s)
+        return price, size, price * size
+
     def _process_trade_rs_event_message(self, order_fill: Dict[str, Any], all_fillable_order):
         exchange_order_id = str(order_fill.get("oid"))
         fillable_order = all_fillable_order.get(exchange_order_id)
@@ -413,15 +483,16 @@ class HyperliquidExchange(ExchangePyBase):
                 flat_fees=[TokenAmount(amount=Decimal(order_fill["fee"]), token=fee_asset)]
             )
 
+            fill_price, fill_size, fill_quote = self._fill_amounts(order_fill["px"], order_fill["sz"])
             trade_update = TradeUpdate(
                 trade_id=str(order_fill["tid"]),
                 client_order_id=fillable_order.client_order_id,
-                exchange_order_id=str(order_fill["oid"]),
+                exchange_order_id=exchange_order_id,
                 trading_pair=fillable_order.trading_pair,
                 fee=fee,
-                fill_base_amount=Decimal(order_fill["sz"]),
-                fill_quote_amount=Decimal(order_fill["px"]) * Decimal(order_fill["sz"]),
-                fill_price=Decimal(order_fill["px"]),
+                fill_base_amount=fill_size,
+                fill_quote_amount=fill_quote,
+                fill_price=fill_price,
                 fill_timestamp=order_fill["time"] * 1e-3,
             )
 
@@ -441,36 +512,55 @@ class HyperliquidExchange(ExchangePyBase):
                 )
                 await self._sleep(1.0)
 
+    async def _process_user_order_updates(self, results: List[Dict[str, Any]]):
+        # The updatable-order view is rebuilt on every property read; resolve it once
+        # for the whole batch since nothing awaits between messages
+        updatable_orders = self._order_tracker.all_updatable_orders
+        for order_msg in results:
+            self._process_order_message(order_msg, updatable_orders=updatable_orders)
+
+    async def _process_user_event_updates(self, results: Dict[str, Any]):
+        fills = results.get("fills")
+        if not fills:
+            return
+        # Parse the whole batch of fills first, then dispatch them in a tight loop so the
+        # per-fill tracker work is not interleaved with parsing awaits
+        trade_updates = []
+        append_update = trade_updates.append
+        trade_update_from_fill = self._trade_update_from_fill
+        fee_schema = self.trade_fee_schema()
+        for trade_msg in fills:
+            client_order_id = str(trade_msg.get("cloid", ""))
+            trade_update = await trade_update_from_fill(trade_msg, client_order_id, fee_schema=fee_schema)
+            if trade_update is not None:
+                append_update(trade_update)
+        process_trade_update = self._order_tracker.process_trade_update
+        for trade_update in trade_updates:
+            process_trade_update(trade_update)
+
     async def _user_stream_event_listener(self):
         """
         Listens to messages from _user_stream_tracker.user_stream queue.
         Traders, Orders, and Balance updates from the WS.
         """
-        user_channels = [
-            CONSTANTS.USER_ORDERS_ENDPOINT_NAME,
-            CONSTANTS.USEREVENT_ENDPOINT_NAME,
-        ]
+        channel_handlers = {
+            CONSTANTS.USER_ORDERS_ENDPOINT_NAME: self._process_user_order_updates,
+            CONSTANTS.USEREVENT_ENDPOINT_NAME: self._process_user_event_updates,
+        }
         async for event_message in self._iter_user_event_queue():
             try:
-                if isinstance(event_message, dict):
+                try:
                     channel: str = event_message.get("channel", None)
                     results = event_message.get("data", None)
-                elif event_message is asyncio.CancelledError:
-                    raise asyncio.CancelledError
-                else:
+                except AttributeError:
+                    # Non-dict payloads never occur in normal operation; keep the failure loud
                     raise Exception(event_message)
-                if channel not in user_channels:
+                handler = channel_handlers.get(channel)
+                if handler is None:
                     self.logger().error(
                         f"Unexpected message in user stream: {event_message}.", exc_info=True)
                     continue
-                if channel == CONSTANTS.USER_ORDERS_ENDPOINT_NAME:
-                    for order_msg in results:
-                        self._process_order_message(order_msg)
-                elif channel == CONSTANTS.USEREVENT_ENDPOINT_NAME:
-                    if "fills" in results:
-                        for trade_msg in results["fills"]:
-                            client_order_id = str(trade_msg.get("cloid", ""))
-                            await self._process_trade_message(trade_msg, client_order_id)
+                await handler(results)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -478,11 +568,15 @@ class HyperliquidExchange(ExchangePyBase):
                     "Unexpected error in user stream listener loop.", exc_info=True)
                 await self._sleep(5.0)
 
-    async def _process_trade_message(self, trade: Dict[str, Any], client_order_id: Optional[str] = None):
+    async def _trade_update_from_fill(
+            self,
+            trade: Dict[str, Any],
+            client_order_id: Optional[str] = None,
+            fee_schema: Optional[TradeFeeSchema] = None) -> Optional[TradeUpdate]:
         """
-        Updates in-flight order and trigger order filled event for a trade message received. Triggers order completedim
-        event if the total executed amount equals to the specified order amount.
-        Example Trade:
+        Builds the TradeUpdate for a fill message, or None when the fill does not belong to a tracked order.
+
+        Batched callers can pass the fee schema to avoid re-resolving it per fill.
         """
         tracked_order = self._order_tracker.all_fillable_orders.get(client_order_id)
 
@@ -492,34 +586,49 @@ class HyperliquidExchange(ExchangePyBase):
             if exchange_symbol == trading_pair_base_coin:
                 fee_asset = trade["feeToken"]
                 fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
+                    fee_schema=fee_schema if fee_schema is not None else self.trade_fee_schema(),
                     trade_type=tracked_order.trade_type,
                     percent_token=fee_asset,
                     flat_fees=[TokenAmount(amount=Decimal(trade["fee"]), token=fee_asset)]
                 )
-                trade_update: TradeUpdate = TradeUpdate(
+                fill_price, fill_size, fill_quote = self._fill_amounts(trade["px"], trade["sz"])
+                return TradeUpdate(
                     trade_id=str(trade["tid"]),
                     client_order_id=tracked_order.client_order_id,
                     exchange_order_id=str(trade["oid"]),
                     trading_pair=tracked_order.trading_pair,
                     fill_timestamp=trade["time"] * 1e-3,
-                    fill_price=Decimal(trade["px"]),
-                    fill_base_amount=Decimal(trade["sz"]),
-                    fill_quote_amount=Decimal(trade["px"]) * Decimal(trade["sz"]),
+                    fill_price=fill_price,
+                    fill_base_amount=fill_size,
+                    fill_quote_amount=fill_quote,
                     fee=fee,
                 )
-                self._order_tracker.process_trade_update(trade_update)
+        return None
 
-    def _process_order_message(self, order_msg: Dict[str, Any]):
+    async def _process_trade_message(self, trade: Dict[str, Any], client_order_id: Optional[str] = None):
+        """
+        Updates in-flight order and trigger order filled event for a trade message received. Triggers order completedim
+        event if the total executed amount equals to the specified order amount.
+        Example Trade:
+        """
+        trade_update = await self._trade_update_from_fill(trade, client_order_id)
+        if trade_update is not None:
+            self._order_tracker.process_trade_update(trade_update)
+
+    def _process_order_message(self, order_msg: Dict[str, Any], updatable_orders: Optional[Dict[str, Any]] = None):
         """
         Updates in-flight order and triggers cancelation or failure event if needed.
 
         :param order_msg: The order response from either REST or web socket API (they are of the same format)
+        :param updatable_orders: optional pre-resolved updatable-order view, so batched
+            callers do not rebuild it per message
 
         Example Order:
         """
+        if updatable_orders is None:
+            updatable_orders = self._order_tracker.all_updatable_orders
         client_order_id = str(order_msg["order"].get("cloid", ""))
-        tracked_order = self._order_tracker.all_updatable_orders.get(client_order_id)
+        tracked_order = updatable_orders.get(client_order_id)
         if not tracked_order:
             self.logger().debug(f"Ignoring order message with id {client_order_id}: not in in_flight_orders.")
             return
@@ -542,28 +651,19 @@ class HyperliquidExchange(ExchangePyBase):
         exchange_info_dict:
             Trading rules dictionary response from the exchange
         """
-        self.coin_to_asset = {}
-        self.name_to_coin = {}
-
-        self.coin_to_asset = {asset_info["name"]: asset for (asset, asset_info) in enumerate(exchange_info_dict[0]["universe"])}
-        self.name_to_coin = {asset_info["name"]: asset_info["name"] for asset_info in exchange_info_dict[0]["universe"]}
-
+        # The asset and name maps were already rebuilt from this same payload by
+        # _initialize_trading_pair_symbols_from_exchange_info, so this method walks the
+        # universe only once more to emit the trading rules
         coin_infos: list = exchange_info_dict[0]["universe"]
         price_infos: list = exchange_info_dict[1]
 
-        for spot_info in filter(web_utils.is_exchange_information_valid, exchange_info_dict[0]["universe"]):
-            self.coin_to_asset[spot_info["name"]] = spot_info["index"] + 10000
-            self.name_to_coin[spot_info["name"]] = spot_info["name"]
+        symbol_map = await self.trading_pair_symbol_map()
 
         return_val: list = []
         for coin_info, price_info in zip(coin_infos, price_infos):
             base, quote = coin_info["tokens"]
             try:
-                ex_name = f'{exchange_info_dict[0]["tokens"][base]["name"].replace(" ", "").upper()}/{exchange_info_dict[0]["tokens"][quote]["name"].replace(" ", "").upper()}'
-                if ex_name not in self.name_to_coin:
-                    self.name_to_coin[ex_name] = coin_info["name"]
-
-                trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=coin_info["name"])
+                trading_pair = symbol_map[coin_info["name"]]
                 step_size = Decimal(str(10 ** -exchange_info_dict[0]["tokens"][base].get("szDecimals")))
                 price_size = Decimal(str(10 ** -len(price_info.get("markPx").split('.')[1])))
                 return_val.append(
@@ -580,9 +680,13 @@ class HyperliquidExchange(ExchangePyBase):
         return return_val
 
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: List):
-        mapping = bidict()
+        # Plain forward/inverse dicts are used for the per-market inserts; the bidict (which keeps
+        # both directions in sync with integrity checks on every insert) is built once at the end.
+        fwd: Dict[str, str] = {}
+        inv: Dict[str, str] = {}
         self.coin_to_asset = {}
         self.name_to_coin = {}
+        self._trading_pair_to_asset.clear()
 
         self.coin_to_asset = {asset_info["name"]: asset for (asset, asset_info) in enumerate(exchange_info[0]["universe"])}
 
@@ -600,13 +704,15 @@ class HyperliquidExchange(ExchangePyBase):
 
             new_base, new_quote = name.split("/")
             trading_pair = combine_to_hb_trading_pair(new_base, new_quote)
-            if trading_pair in mapping.inverse:
-                self._resolve_trading_pair_symbols_duplicate(mapping, name, new_base, new_quote)
+            if trading_pair in inv:
+                self._resolve_trading_pair_symbols_duplicate(fwd, inv, name, new_base, new_quote)
             else:
-                mapping[ex_name] = trading_pair
-        self._set_trading_pair_symbol_map(mapping)
+                fwd[ex_name] = trading_pair
+                inv[trading_pair] = ex_name
+        self._set_trading_pair_symbol_map(bidict(fwd))
 
-    def _resolve_trading_pair_symbols_duplicate(self, mapping: bidict, new_exchange_symbol: str, base: str, quote: str):
+    def _resolve_trading_pair_symbols_duplicate(self, fwd: Dict[str, str], inv: Dict[str, str],
+                                                new_exchange_symbol: str, base: str, quote: str):
         """Resolves name conflicts provoked by futures contracts.
 
         If the expected BASEQUOTE combination matches one of the exchange symbols, it is the one taken, otherwise,
@@ -614,41 +720,45 @@ class HyperliquidExchange(ExchangePyBase):
         """
         expected_exchange_symbol = f"{base}{quote}"
         trading_pair = combine_to_hb_trading_pair(base, quote)
-        current_exchange_symbol = mapping.inverse[trading_pair]
+        current_exchange_symbol = inv[trading_pair]
         if current_exchange_symbol == expected_exchange_symbol:
             pass
         elif new_exchange_symbol == expected_exchange_symbol:
-            mapping.pop(current_exchange_symbol)
-            mapping[new_exchange_symbol] = trading_pair
+            fwd.pop(current_exchange_symbol)
+            fwd[new_exchange_symbol] = trading_pair
+            inv[trading_pair] = new_exchange_symbol
         else:
             self.logger().error(
                 f"Could not resolve the exchange symbols {new_exchange_symbol} and {current_exchange_symbol}")
-            mapping.pop(current_exchange_symbol)
+            fwd.pop(current_exchange_symbol)
+            inv.pop(trading_pair)
 
     async def _update_balances(self):
         """
         Calls the REST API to update total and available balances.
         """
-        local_asset_names = set(self._account_balances.keys())
-        remote_asset_names = set()
-
         account_info = await self._api_post(path_url=CONSTANTS.ACCOUNT_INFO_URL,
                                             data={"type": CONSTANTS.USER_STATE_TYPE,
                                                   "user": self.hyperliquid_api_key},
                                             )
-        balances = account_info["balances"]
-        for balance_entry in balances:
+        new_available_balances: Dict[str, Decimal] = {}
+        new_balances: Dict[str, Decimal] = {}
+        for balance_entry in account_info["balances"]:
             asset_name = balance_entry["coin"]
-            free_balance = Decimal(balance_entry["total"]) - Decimal(balance_entry["hold"])
             total_balance = Decimal(balance_entry["total"])
-            self._account_available_balances[asset_name] = free_balance
-            self._account_balances[asset_name] = total_balance
-            remote_asset_names.add(asset_name)
-
-        asset_names_to_remove = local_asset_names.difference(remote_asset_names)
-        for asset_name in asset_names_to_remove:
-            del self._account_available_balances[asset_name]
-            del self._account_balances[asset_name]
+            new_available_balances[asset_name] = total_balance - Decimal(balance_entry["hold"])
+            new_balances[asset_name] = total_balance
+        # Apply as a diff instead of clear-and-rewrite: only assets whose value changed are
+        # touched, and assets no longer reported by the exchange are dropped
+        for tracked, fresh in (
+            (self._account_available_balances, new_available_balances),
+            (self._account_balances, new_balances),
+        ):
+            for asset_name in tracked.keys() - fresh.keys():
+                del tracked[asset_name]
+            for asset_name, value in fresh.items():
+                if tracked.get(asset_name) != value:
+                    tracked[asset_name] = value
 
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         client_order_id = tracked_order.client_order_id
@@ -708,6 +818,7 @@ class HyperliquidExchange(ExchangePyBase):
 
             self.logger().debug(f"Polling for order fills of {len(tasks)} trading pairs.")
             results = await safe_gather(*tasks, return_exceptions=True)
+            fee_schema = self.trade_fee_schema()
 
             for trades, trading_pair in zip(results, trading_pairs):
 
@@ -723,20 +834,21 @@ class HyperliquidExchange(ExchangePyBase):
                         # This is a fill for a tracked order
                         tracked_order = order_by_exchange_id_map[exchange_order_id]
                         fee = TradeFeeBase.new_spot_fee(
-                            fee_schema=self.trade_fee_schema(),
+                            fee_schema=fee_schema,
                             trade_type=tracked_order.trade_type,
                             percent_token=trade["feeToken"],
                             flat_fees=[TokenAmount(amount=Decimal(trade["fee"]), token=trade["feeToken"])]
                         )
+                        fill_price, fill_size, fill_quote = self._fill_amounts(trade["px"], trade["sz"])
                         trade_update = TradeUpdate(
                             trade_id=str(trade["tid"]),
                             client_order_id=tracked_order.client_order_id,
                             exchange_order_id=exchange_order_id,
                             trading_pair=trading_pair,
                             fee=fee,
-                            fill_base_amount=Decimal(trade["sz"]),
-                            fill_quote_amount=Decimal(trade["sz"]) * Decimal(trade["px"]),
-                            fill_price=Decimal(trade["px"]),
+                            fill_base_amount=fill_size,
+                            fill_quote_amount=fill_quote,
+                            fill_price=fill_price,
                             fill_timestamp=trade["time"] * 1e-3,
                         )
                         self._order_tracker.process_trade_update(trade_update)
@@ -772,7 +884,6 @@ class HyperliquidExchange(ExchangePyBase):
         trade_updates = []
 
         if order.exchange_order_id is not None:
-            exchange_order_id = int(order.exchange_order_id)
             trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
             all_fills_response = await self._api_get(
                 path_url=CONSTANTS.MY_TRADES_PATH_URL,
@@ -783,26 +894,34 @@ class HyperliquidExchange(ExchangePyBase):
                 is_auth_required=True,
                 limit_id=CONSTANTS.MY_TRADES_PATH_URL)
 
+            # Pre-bind the per-row callables and invariant order fields; the response holds
+            # every user fill, so the loop body runs once per fill in the account history
+            fee_schema = self.trade_fee_schema()
+            new_spot_fee = TradeFeeBase.new_spot_fee
+            fill_amounts = self._fill_amounts
+            trade_type = order.trade_type
+            client_order_id = order.client_order_id
+            append_update = trade_updates.append
             for trade in all_fills_response:
-                exchange_order_id = str(trade["orderId"])
-                fee = TradeFeeBase.new_spot_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    trade_type=order.trade_type,
-                    percent_token=trade["feeToken"],
-                    flat_fees=[TokenAmount(amount=Decimal(trade["fee"]), token=trade["feeToken"])]
+                fee_token = trade["feeToken"]
+                fee = new_spot_fee(
+                    fee_schema=fee_schema,
+                    trade_type=trade_type,
+                    percent_token=fee_token,
+                    flat_fees=[TokenAmount(amount=Decimal(trade["fee"]), token=fee_token)]
                 )
-                trade_update = TradeUpdate(
+                fill_price, fill_size, fill_quote = fill_amounts(trade["px"], trade["sz"])
+                append_update(TradeUpdate(
                     trade_id=str(trade["tid"]),
-                    client_order_id=order.client_order_id,
-                    exchange_order_id=exchange_order_id,
+                    client_order_id=client_order_id,
+                    exchange_order_id=str(trade["orderId"]),
                     trading_pair=trading_pair,
                     fee=fee,
-                    fill_base_amount=Decimal(trade["sz"]),
-                    fill_quote_amount=Decimal(trade["sz"]) * Decimal(trade["px"]),
-                    fill_price=Decimal(trade["px"]),
+                    fill_base_amount=fill_size,
+                    fill_quote_amount=fill_quote,
+                    fill_price=fill_price,
                     fill_timestamp=trade["time"] * 1e-3,
-                )
-                trade_updates.append(trade_update)
+                ))
 
         return trade_updates
 
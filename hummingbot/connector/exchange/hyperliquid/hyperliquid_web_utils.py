@@ -1,5 +1,6 @@
 import time
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 import hummingbot.connector.exchange.hyperliquid.hyperliquid_constants as CONSTANTS
@@ -29,6 +30,7 @@ def public_rest_url(*args, **kwargs) -> str:
     return rest_url(*args, **kwargs)
 
 
+@lru_cache(maxsize=None)
 def rest_url(path_url: str, domain: str = "hyperliquid"):
     base_url = CONSTANTS.BASE_URL if domain == "hyperliquid" else CONSTANTS.TESTNET_BASE_URL
     return base_url + path_url
@@ -42,6 +44,11 @@ def wss_url(domain: str = "hyperliquid"):
 def build_api_factory(
         throttler: Optional[AsyncThrottler] = None,
         auth: Optional[AuthBase] = None) -> WebAssistantsFactory:
+    """
+    Builds the factory the connector keeps for its whole lifetime. All factories share the
+    process-wide pooled aiohttp session owned by ConnectionsFactory, so REST calls reuse
+    connections instead of paying a TCP/TLS handshake per request.
+    """
     throttler = throttler or create_throttler()
     api_factory = WebAssistantsFactory(
         throttler=throttler,
@@ -140,7 +147,7 @@ def order_spec_to_order_wire(order_spec):
 
 
 def float_to_wire(x: float) -> str:
-    rounded = "{:.8f}".format(x)
+    rounded = f"{x:.8f}"
     if abs(float(rounded) - x) >= 1e-12:
         raise ValueError("float_to_wire causes rounding", x)
     if rounded == "-0":
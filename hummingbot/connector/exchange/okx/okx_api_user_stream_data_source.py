@@ -58,27 +58,20 @@ class OkxAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def _subscribe_channels(self, websocket_assistant: WSAssistant):
         try:
-            payload = {
-                "op": "subscribe",
-                "args": [{"channel": "account"}],
-            }
-            subscribe_account_request: WSJSONRequest = WSJSONRequest(payload=payload)
-
             payload = {
                 "op": "subscribe",
                 "args": [
+                    {"channel": "account"},
                     {
                         "channel": "orders",
                         "instType": "SPOT",
-                    }
-                ]
+                    },
+                ],
             }
-            subscribe_orders_request: WSJSONRequest = WSJSONRequest(payload=payload)
+            subscribe_request: WSJSONRequest = WSJSONRequest(payload=payload)
 
             async with self._api_factory.throttler.execute_task(limit_id=CONSTANTS.WS_SUBSCRIPTION_LIMIT_ID):
-                await websocket_assistant.send(subscribe_account_request)
-            async with self._api_factory.throttler.execute_task(limit_id=CONSTANTS.WS_SUBSCRIPTION_LIMIT_ID):
-                await websocket_assistant.send(subscribe_orders_request)
+                await websocket_assistant.send(subscribe_request)
             self.logger().info("Subscribed to private account and orders channels...")
         except asyncio.CancelledError:
             raise
@@ -221,7 +221,7 @@ class NetworkMockingAssistant:
         ws.__aexit__.return_value = None
 
         # Set side effects using async_partial with ignore_first_arg if needed.
-        ws.send_json.side_effect = lambda sent_message: self._sent_websocket_json_messages[stable_key].append(
+        ws.send_json.side_effect = lambda sent_message, **kwargs: self._sent_websocket_json_messages[stable_key].append(
             sent_message)
         ws.send.side_effect = lambda sent_message: self._sent_websocket_text_messages[stable_key].append(sent_message)
         ws.send_str.side_effect = lambda sent_message: self._sent_websocket_text_messages[stable_key].append(
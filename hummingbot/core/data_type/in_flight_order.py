@@ -36,6 +36,21 @@ class OrderState(Enum):
     COMPLETED = 10
 
 
+# Built once at import time: is_open/is_done are read per order on every tick, and a set
+# literal of enum members would otherwise be rebuilt on each property access
+OPEN_ORDER_STATES = frozenset((
+    OrderState.PENDING_CREATE,
+    OrderState.OPEN,
+    OrderState.PARTIALLY_FILLED,
+    OrderState.PENDING_CANCEL,
+))
+TERMINAL_ORDER_STATES = frozenset((
+    OrderState.CANCELED,
+    OrderState.FILLED,
+    OrderState.FAILED,
+))
+
+
 class OrderUpdate(NamedTuple):
     trading_pair: str
     update_timestamp: float  # seconds
@@ -179,16 +194,12 @@ class InFlightOrder:
 
     @property
     def is_open(self) -> bool:
-        return self.current_state in {
-            OrderState.PENDING_CREATE,
-            OrderState.OPEN,
-            OrderState.PARTIALLY_FILLED,
-            OrderState.PENDING_CANCEL}
+        return self.current_state in OPEN_ORDER_STATES
 
     @property
     def is_done(self) -> bool:
         return (
-            self.current_state in {OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED}
+            self.current_state in TERMINAL_ORDER_STATES
             or math.isclose(self.executed_amount_base, self.amount)
             or self.executed_amount_base >= self.amount
         )
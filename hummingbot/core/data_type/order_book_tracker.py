@@ -196,23 +196,29 @@ class OrderBookTracker:
 
         while True:
             try:
-                ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
+                # Wait for the first message, then drain whatever else is already queued so a
+                # burst of diffs is routed in a single task switch instead of one per message
+                messages: List[OrderBookMessage] = [await self._order_book_diff_stream.get()]
+                while not self._order_book_diff_stream.empty():
+                    messages.append(self._order_book_diff_stream.get_nowait())
+
+                for ob_message in messages:
+                    trading_pair: str = ob_message.trading_pair
+
+                    if trading_pair not in self._tracking_message_queues:
+                        messages_queued += 1
+                        # Save diff messages received before snapshots are ready
+                        self._saved_message_queues[trading_pair].append(ob_message)
+                        continue
+                    message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+                    # Check the order book's initial update ID. If it's larger, don't bother.
+                    order_book: OrderBook = self._order_books[trading_pair]
+
+                    if order_book.snapshot_uid > ob_message.update_id:
+                        messages_rejected += 1
+                        continue
+                    await message_queue.put(ob_message)
+                    messages_accepted += 1
 
                 # Log some statistics.
                 now: float = time.time()
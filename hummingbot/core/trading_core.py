@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import importlib
 import inspect
 import logging
@@ -40,6 +41,39 @@ from hummingbot.strategy.strategy_v2_base import StrategyV2Base, StrategyV2Confi
 s_decimal_0 = Decimal("0")
 
 
+@functools.lru_cache(maxsize=64)
+def _resolve_script_classes(script_name: str, _mtime: float) -> Tuple[Any, Type, Optional[Type]]:
+    """
+    Import (or reload) a script strategy module and discover its strategy and config classes.
+
+    The script file's modification time is part of the cache key, so edited scripts are
+    re-imported while repeated loads of an unchanged script skip both the module reload
+    and the class scan.
+    """
+    module = sys.modules.get(f"{SCRIPT_STRATEGIES_MODULE}.{script_name}")
+
+    if module is not None:
+        script_module = importlib.reload(module)
+    else:
+        script_module = importlib.import_module(f".{script_name}", package=SCRIPT_STRATEGIES_MODULE)
+
+    # vars() avoids the sorted dir()-based scan inspect.getmembers performs
+    module_classes = [member for member in vars(script_module).values() if inspect.isclass(member)]
+
+    try:
+        script_class = next((member for member in module_classes
+                             if issubclass(member, ScriptStrategyBase) and
+                             member not in [ScriptStrategyBase, DirectionalStrategyBase, StrategyV2Base]))
+    except StopIteration:
+        raise InvalidScriptModule(f"The module {script_name} does not contain any subclass of ScriptStrategyBase")
+
+    config_class = next((member for member in module_classes
+                         if issubclass(member, BaseClientModel) and
+                         member not in [BaseClientModel, StrategyV2ConfigBase]), None)
+
+    return script_module, script_class, config_class
+
+
 class StrategyType(Enum):
     SCRIPT = "script"
     REGULAR = "regular"
@@ -90,6 +124,7 @@ class TradingCore:
 
         # Strategy paths
         self.scripts_path = scripts_path or Path("scripts")
+        self._strategy_type_cache: Dict[Tuple[str, float], StrategyType] = {}
 
         # Core components
         self.connector_manager = ConnectorManager(self.client_config_map)
@@ -317,18 +352,33 @@ class TradingCore:
 
     def detect_strategy_type(self, strategy_name: str) -> StrategyType:
         """Detect the type of strategy."""
+        # The script's mtime is part of the cache key (mirroring _resolve_script_classes) so a
+        # script edited in-session to change kind (SCRIPT <-> V2) is re-detected on restart
+        cache_key = (strategy_name, self._script_mtime(strategy_name))
+        strategy_type = self._strategy_type_cache.get(cache_key)
+        if strategy_type is not None:
+            return strategy_type
         if self.is_script_strategy(strategy_name):
             # Check if it's a V2 strategy by examining the script
-            return StrategyType.V2 if self._is_v2_script_strategy(strategy_name) else StrategyType.SCRIPT
+            strategy_type = StrategyType.V2 if self._is_v2_script_strategy(strategy_name) else StrategyType.SCRIPT
         elif strategy_name in STRATEGIES:
-            return StrategyType.REGULAR
+            strategy_type = StrategyType.REGULAR
         else:
             raise ValueError(f"Unknown strategy: {strategy_name}")
+        self._strategy_type_cache[cache_key] = strategy_type
+        return strategy_type
 
     def is_script_strategy(self, strategy_name: str) -> bool:
         """Check if the strategy is a script strategy."""
         script_file = self.scripts_path / f"{strategy_name}.py"
-        return script_file.exists()
+        return script_file.is_file()
+
+    def _script_mtime(self, script_name: str) -> float:
+        """Returns the script file's modification time, or -1.0 when it cannot be read."""
+        try:
+            return (self.scripts_path / f"{script_name}.py").stat().st_mtime
+        except OSError:
+            return -1.0
 
     def _is_v2_script_strategy(self, strategy_name: str) -> bool:
         """Check if a script strategy is a V2 strategy."""
@@ -354,7 +404,7 @@ class TradingCore:
                 db_name = self._strategy_file_name or "trades"
 
         if db_name.endswith(".yml") or db_name.endswith(".py"):
-            db_name = db_name.split(".")[0]
+            db_name = Path(db_name).stem
 
         self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(
             self.client_config_map, db_name
@@ -382,34 +432,16 @@ class TradingCore:
             Tuple of (strategy_class, config_object)
         """
         config = None
-        module = sys.modules.get(f"{SCRIPT_STRATEGIES_MODULE}.{script_name}")
-
-        if module is not None:
-            script_module = importlib.reload(module)
-        else:
-            script_module = importlib.import_module(f".{script_name}", package=SCRIPT_STRATEGIES_MODULE)
-
-        try:
-            script_class = next((member for member_name, member in inspect.getmembers(script_module)
-                                 if inspect.isclass(member) and
-                                 issubclass(member, ScriptStrategyBase) and
-                                 member not in [ScriptStrategyBase, DirectionalStrategyBase, StrategyV2Base]))
-        except StopIteration:
-            raise InvalidScriptModule(f"The module {script_name} does not contain any subclass of ScriptStrategyBase")
+        _, script_class, config_class = _resolve_script_classes(script_name, self._script_mtime(script_name))
 
         # Load config if strategy and file names differ
         if self.strategy_name != self._strategy_file_name and self._strategy_file_name:
-            try:
-                config_class = next((member for member_name, member in inspect.getmembers(script_module)
-                                     if inspect.isclass(member) and
-                                     issubclass(member, BaseClientModel) and
-                                     member not in [BaseClientModel, StrategyV2ConfigBase]))
-                # Load config from provided config dict or file
-                config_data = self._load_strategy_config()
-                config = config_class(**config_data)
-                script_class.init_markets(config)
-            except StopIteration:
+            if config_class is None:
                 raise InvalidScriptModule(f"The module {script_name} does not contain any subclass of BaseClientModel")
+            # Load config from provided config dict or file
+            config_data = self._load_strategy_config()
+            config = config_class(**config_data)
+            script_class.init_markets(config)
 
         return script_class, config
 
@@ -432,6 +464,11 @@ class TradingCore:
         """Load YAML configuration file for script strategies."""
         import yaml
 
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
         from hummingbot.client.settings import SCRIPT_STRATEGY_CONF_DIR_PATH
 
         try:
@@ -443,7 +480,7 @@ class TradingCore:
                 config_path = SCRIPT_STRATEGY_CONF_DIR_PATH / config_file_path
 
             with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=SafeLoader)
         except Exception as e:
             self.logger().warning(f"Failed to load config file {config_file_path}: {e}")
             return {}
@@ -1,9 +1,9 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
+import ujson
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
@@ -133,7 +133,8 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        # Encode with ujson to match the receive side and avoid the slower stdlib default
+        await self._connection.send_json(payload, dumps=ujson.dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -147,8 +148,8 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=ujson.loads)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
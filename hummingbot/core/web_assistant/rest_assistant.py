@@ -1,8 +1,9 @@
-import json
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
+import ujson
+
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
@@ -78,7 +79,7 @@ class RESTAssistant:
 
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = ujson.dumps(data) if data is not None else data
 
         request = RESTRequest(
             method=method,
@@ -22,6 +22,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketOrderFailureEvent, SellOrderCreatedEvent
 from hummingbot.core.network_iterator import NetworkStatus
@@ -921,6 +922,152 @@ class HyperliquidPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.Perpe
         self.assertIn(order.client_order_id, self.exchange._order_tracker.lost_orders)
         self.assertEqual(0, len(self.order_cancelled_logger.event_log))
 
+    @aioresponses()
+    def test_batch_order_cancel_cancels_all_orders_in_one_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="0x48424f54424548554436306163303012",  # noqa: mock
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        self.exchange.start_tracking_order(
+            order_id="0x48424f54424548554436306163303013",  # noqa: mock
+            exchange_order_id="5",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("11000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        first_order = self.exchange.in_flight_orders["0x48424f54424548554436306163303012"]  # noqa: mock
+        second_order = self.exchange.in_flight_orders["0x48424f54424548554436306163303013"]  # noqa: mock
+
+        url = web_utils.public_rest_url(CONSTANTS.CANCEL_ORDER_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
+        response = {'status': 'ok', 'response': {'type': 'cancel', 'data': {'statuses': ['success', 'success']}}}
+        mock_api.post(regex_url,
+                      body=json.dumps(response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.exchange.batch_order_cancel(orders_to_cancel=[
+            first_order.to_limit_order(),
+            second_order.to_limit_order(),
+        ])
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual("cancelByCloid", request_data["action"]["type"])
+        self.assertEqual(
+            [first_order.client_order_id, second_order.client_order_id],
+            [cancel["cloid"] for cancel in request_data["action"]["cancels"]])
+
+        self.assertNotIn(first_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertNotIn(second_order.client_order_id, self.exchange.in_flight_orders)
+        cancelled_order_ids = [event.order_id for event in self.order_cancelled_logger.event_log]
+        self.assertIn(first_order.client_order_id, cancelled_order_ids)
+        self.assertIn(second_order.client_order_id, cancelled_order_ids)
+
+    @aioresponses()
+    def test_batch_order_cancel_keeps_order_tracked_on_partial_failure(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="0x48424f54424548554436306163303012",  # noqa: mock
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        self.exchange.start_tracking_order(
+            order_id="0x48424f54424548554436306163303013",  # noqa: mock
+            exchange_order_id="5",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("11000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        first_order = self.exchange.in_flight_orders["0x48424f54424548554436306163303012"]  # noqa: mock
+        second_order = self.exchange.in_flight_orders["0x48424f54424548554436306163303013"]  # noqa: mock
+
+        url = web_utils.public_rest_url(CONSTANTS.CANCEL_ORDER_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
+        response = {'status': 'ok', 'response': {'type': 'cancel', 'data': {
+            'statuses': ['success', {'error': 'Order already canceled'}]}}}
+        mock_api.post(regex_url,
+                      body=json.dumps(response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.exchange.batch_order_cancel(orders_to_cancel=[
+            first_order.to_limit_order(),
+            second_order.to_limit_order(),
+        ])
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        self.assertNotIn(first_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertIn(second_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertTrue(
+            self.is_logged(
+                "WARNING",
+                f"Failed to cancel order {second_order.client_order_id}: Order already canceled"))
+
+    @aioresponses()
+    def test_batch_order_cancel_skips_untracked_orders(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="0x48424f54424548554436306163303012",  # noqa: mock
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        tracked_order = self.exchange.in_flight_orders["0x48424f54424548554436306163303012"]  # noqa: mock
+        untracked_order = LimitOrder(
+            client_order_id="0x48424f54424548554436306163303099",  # noqa: mock
+            trading_pair=self.trading_pair,
+            is_buy=True,
+            base_currency=self.base_asset,
+            quote_currency=self.quote_asset,
+            price=Decimal("10000"),
+            quantity=Decimal("100"),
+        )
+
+        url = web_utils.public_rest_url(CONSTANTS.CANCEL_ORDER_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?") + ".*")
+        response = {'status': 'ok', 'response': {'type': 'cancel', 'data': {'statuses': ['success']}}}
+        mock_api.post(regex_url,
+                      body=json.dumps(response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.exchange.batch_order_cancel(orders_to_cancel=[tracked_order.to_limit_order(), untracked_order])
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual(
+            [tracked_order.client_order_id],
+            [cancel["cloid"] for cancel in request_data["action"]["cancels"]])
+        self.assertNotIn(tracked_order.client_order_id, self.exchange.in_flight_orders)
+
     @aioresponses()
     def test_user_stream_update_for_order_full_fill(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
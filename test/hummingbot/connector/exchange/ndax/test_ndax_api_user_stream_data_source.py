@@ -196,7 +196,7 @@ class NdaxAPIUserStreamDataSourceTests(IsolatedAsyncioWrapperTestCase):
     def test_listening_process_canceled_when_cancel_exception_during_authentication(self, ws_connect_mock):
         messages = asyncio.Queue()
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
-        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message: (
+        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message, **kwargs: (
             self._raise_exception(asyncio.CancelledError)
             if CONSTANTS.AUTHENTICATE_USER_ENDPOINT_NAME in sent_message['n']
             else self.mocking_assistant._sent_websocket_json_messages[ws_connect_mock.return_value].append(sent_message))
@@ -210,7 +210,7 @@ class NdaxAPIUserStreamDataSourceTests(IsolatedAsyncioWrapperTestCase):
     def test_listening_process_canceled_when_cancel_exception_during_events_subscription(self, ws_connect_mock):
         messages = asyncio.Queue()
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
-        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message: (
+        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message, **kwargs: (
             self._raise_exception(asyncio.CancelledError)
             if CONSTANTS.SUBSCRIBE_ACCOUNT_EVENTS_ENDPOINT_NAME in sent_message['n']
             else self.mocking_assistant._sent_websocket_json_messages[ws_connect_mock.return_value].append(sent_message))
@@ -228,7 +228,7 @@ class NdaxAPIUserStreamDataSourceTests(IsolatedAsyncioWrapperTestCase):
     def test_listening_process_logs_exception_details_during_authentication(self, ws_connect_mock):
         messages = asyncio.Queue()
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
-        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message: (
+        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message, **kwargs: (
             self._raise_exception(Exception)
             if CONSTANTS.AUTHENTICATE_USER_ENDPOINT_NAME in sent_message['n']
             else self.mocking_assistant._sent_websocket_json_messages[ws_connect_mock.return_value].append(sent_message))
@@ -250,7 +250,7 @@ class NdaxAPIUserStreamDataSourceTests(IsolatedAsyncioWrapperTestCase):
     def test_listening_process_logs_exception_during_events_subscription(self, ws_connect_mock):
         messages = asyncio.Queue()
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
-        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message: (
+        ws_connect_mock.return_value.send_json.side_effect = lambda sent_message, **kwargs: (
             CONSTANTS.SUBSCRIBE_ACCOUNT_EVENTS_ENDPOINT_NAME in sent_message['n'] and self._raise_exception(Exception))
         # Make the close function raise an exception to finish the execution
         ws_connect_mock.return_value.close.side_effect = lambda: self._raise_exception(Exception)
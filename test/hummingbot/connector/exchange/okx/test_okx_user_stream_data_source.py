@@ -93,28 +93,18 @@ class OkxUserStreamDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
             "code": "0",
             "msg": ""
         }
-        result_subscribe_orders = {
+        result_subscribe = {
             "event": "subscribe",
             "arg": {
                 "channel": "account"
             }
         }
-        result_subscribe_account = {
-            "event": "subscribe",
-            "arg": {
-                "channel": "orders",
-                "instType": "SPOT",
-            }
-        }
         self.mocking_assistant.add_websocket_aiohttp_message(
             websocket_mock=ws_connect_mock.return_value,
             message=json.dumps(successful_login_response))
         self.mocking_assistant.add_websocket_aiohttp_message(
             websocket_mock=ws_connect_mock.return_value,
-            message=json.dumps(result_subscribe_orders))
-        self.mocking_assistant.add_websocket_aiohttp_message(
-            websocket_mock=ws_connect_mock.return_value,
-            message=json.dumps(result_subscribe_account))
+            message=json.dumps(result_subscribe))
 
         output_queue = asyncio.Queue()
 
@@ -125,7 +115,7 @@ class OkxUserStreamDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
         sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
             websocket_mock=ws_connect_mock.return_value)
 
-        self.assertEqual(3, len(sent_messages))
+        self.assertEqual(2, len(sent_messages))
         expected_login = {
             "op": "login",
             "args": [
@@ -138,25 +128,19 @@ class OkxUserStreamDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
             ]
         }
         self.assertEqual(expected_login, sent_messages[0])
-        expected_account_subscription = {
+        expected_subscription = {
             "op": "subscribe",
             "args": [
                 {
                     "channel": "account"
-                }
-            ]
-        }
-        self.assertEqual(expected_account_subscription, sent_messages[1])
-        expected_orders_subscription = {
-            "op": "subscribe",
-            "args": [
+                },
                 {
                     "channel": "orders",
                     "instType": "SPOT",
-                }
+                },
             ]
         }
-        self.assertEqual(expected_orders_subscription, sent_messages[2])
+        self.assertEqual(expected_subscription, sent_messages[1])
 
         self.assertTrue(self._is_logged(
             "INFO",
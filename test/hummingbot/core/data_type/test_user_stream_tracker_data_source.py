@@ -150,6 +150,47 @@ class TestUserStreamTrackerDataSource(IsolatedAsyncioWrapperTestCase):
 
         self.assertIsNone(self.data_source._ws_assistant)
 
+    @patch("hummingbot.core.data_type.user_stream_tracker_data_source.random.random", return_value=1.0)
+    def test_next_reconnect_delay_grows_exponentially(self, _):
+        with patch.object(MockUserStreamTrackerDataSource, "_time", return_value=100.0):
+            failures, first_delay = self.data_source._next_reconnect_delay(
+                consecutive_failures=0, connected_at=100.0)
+            self.assertEqual(1, failures)
+            self.assertEqual(self.data_source._RECONNECT_INITIAL_DELAY, first_delay)
+
+            failures, second_delay = self.data_source._next_reconnect_delay(
+                consecutive_failures=failures, connected_at=100.0)
+            self.assertEqual(2, failures)
+            self.assertEqual(first_delay * 2, second_delay)
+
+    @patch("hummingbot.core.data_type.user_stream_tracker_data_source.random.random", return_value=1.0)
+    def test_next_reconnect_delay_is_capped(self, _):
+        with patch.object(MockUserStreamTrackerDataSource, "_time", return_value=100.0):
+            failures, delay = self.data_source._next_reconnect_delay(
+                consecutive_failures=100, connected_at=100.0)
+            self.assertEqual(101, failures)
+            self.assertEqual(self.data_source._RECONNECT_MAX_DELAY, delay)
+
+    @patch("hummingbot.core.data_type.user_stream_tracker_data_source.random.random", return_value=1.0)
+    def test_next_reconnect_delay_resets_after_stable_connection(self, _):
+        stable_time = 100.0 + self.data_source._RECONNECT_STABLE_CONNECTION_TIME
+        with patch.object(MockUserStreamTrackerDataSource, "_time", return_value=stable_time):
+            failures, delay = self.data_source._next_reconnect_delay(
+                consecutive_failures=10, connected_at=100.0)
+            self.assertEqual(1, failures)
+            self.assertEqual(self.data_source._RECONNECT_INITIAL_DELAY, delay)
+
+    def test_next_reconnect_delay_is_jittered(self):
+        with patch.object(MockUserStreamTrackerDataSource, "_time", return_value=100.0):
+            with patch("hummingbot.core.data_type.user_stream_tracker_data_source.random.random", return_value=0.0):
+                _, min_delay = self.data_source._next_reconnect_delay(
+                    consecutive_failures=0, connected_at=100.0)
+            with patch("hummingbot.core.data_type.user_stream_tracker_data_source.random.random", return_value=1.0):
+                _, max_delay = self.data_source._next_reconnect_delay(
+                    consecutive_failures=0, connected_at=100.0)
+        self.assertEqual(self.data_source._RECONNECT_INITIAL_DELAY * 0.5, min_delay)
+        self.assertEqual(self.data_source._RECONNECT_INITIAL_DELAY, max_delay)
+
 
 if __name__ == '__main__':
     unittest.main()